@@ -6,6 +6,10 @@ window capture, and mouse click simulation.
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import os
+import threading
 import time
 import ctypes
 from typing import Optional, Tuple
@@ -19,16 +23,34 @@ import win32gui  # ty:ignore[unresolved-import]
 import win32process  # ty:ignore[unresolved-import]
 import win32api  # ty:ignore[unresolved-import]
 
+try:
+    import dxcam  # ty:ignore[unresolved-import]
+except ImportError:
+    dxcam = None
+
+try:
+    import numba  # ty:ignore[unresolved-import]
+except ImportError:
+    numba = None
+
 
 # Configuration constants
 PROCESS_NAME = "milthm.exe"
 MATCH_THRESHOLD = 0.9  # Increase if false positives appear.
+# Channel to run matchTemplate on: "gray" matches on a single channel (1/3 of
+# the memory traffic of BGR and robust for sharp-bordered UI templates),
+# "bgr" keeps the original 3-channel NCC.
+MATCH_CHANNEL = "gray"
 DEBUG_SAVE_SCREENSHOTS = False  # Set to True to save screenshots for debugging
 # Scales to try for template matching (supports arbitrary template sizes).
+# Ordered by distance from 1.0 so sweeps that can stop at the first confident
+# hit try the most likely hypotheses first.
 SCALES = [
     1.0,
     0.95,
+    1.05,
     0.9,
+    1.1,
     0.85,
     0.8,
     0.75,
@@ -37,9 +59,17 @@ SCALES = [
     0.6,
     0.55,
     0.5,
-    1.05,
-    1.1,
 ]
+# Coarse-to-fine pyramid search parameters.
+PYRAMID_LEVELS = 3  # pyrDown depth: level 2 is 1/4 size in each dimension.
+MIN_COARSE_SIDE = 8  # Don't shrink templates below this during the coarse pass.
+REFINE_MARGIN = 8  # Extra pixels around the coarse peak when refining.
+REFINE_CANDIDATES = 4  # Coarse candidates to refine at full resolution.
+PREFILTER_KEEP = 6  # Scales surviving the cheap SQDIFF prefilter into the NCC pass.
+NUMBA_MAX_SIDE = 64  # Use the jitted ZNCC kernel for templates up to this size.
+# FFT-based matching parameters.
+FFT_MIN_SIDE = 18  # Use DFT correlation for templates at least this big.
+FFT_MAX_SIDE = 256  # Padding budget; larger templates fall back to spatial NCC.
 
 
 def set_dpi_awareness() -> None:
@@ -55,42 +85,100 @@ def set_dpi_awareness() -> None:
             pass
 
 
+# Cached window handle + pid: EnumWindows walks every top-level window and
+# resolves each pid's executable name, which costs dozens of ms. The cache is
+# validated with a single IsWindow call and only re-enumerated when stale.
+_CACHED_HWND: Optional[int] = None
+_CACHED_PID: Optional[int] = None
+_CACHED_NAME: Optional[str] = None
+
+
+def _process_name_of(pid: int) -> Optional[str]:
+    """Resolve a pid to its executable basename with one OpenProcess syscall."""
+    try:
+        handle = win32api.OpenProcess(
+            win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ, False, pid
+        )
+        try:
+            path = win32process.GetModuleFileNameEx(handle, 0)
+        finally:
+            win32api.CloseHandle(handle)
+        return os.path.basename(path)
+    except Exception:
+        # Access denied or pid gone; fall back to psutil's slower path.
+        try:
+            return psutil.Process(pid).name()
+        except psutil.NoSuchProcess:
+            return None
+
+
 def find_window_for_process(process_name: str) -> Optional[int]:
     """Return the top-level window handle for the given process name."""
+    global _CACHED_HWND, _CACHED_PID, _CACHED_NAME
+
+    # Fast path: the handle from the previous probe, validated cheaply.
+    # IsWindow plus an unchanged pid means it is still the same window.
+    if _CACHED_HWND is not None and _CACHED_NAME == process_name.lower():
+        if win32gui.IsWindow(_CACHED_HWND):
+            _, pid = win32process.GetWindowThreadProcessId(_CACHED_HWND)
+            if pid == _CACHED_PID:
+                return _CACHED_HWND
+        _CACHED_HWND = None
+        _CACHED_PID = None
 
     def _callback(hwnd, results):
         if not win32gui.IsWindowVisible(hwnd):
             return
         _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        try:
-            proc = psutil.Process(pid)
-        except psutil.NoSuchProcess:
-            return
-        if proc.name().lower() == process_name.lower():
-            results.append(hwnd)
+        name = _process_name_of(pid)
+        if name is not None and name.lower() == process_name.lower():
+            results.append((hwnd, pid))
 
-    matches: list[int] = []
+    matches: list[Tuple[int, int]] = []
     win32gui.EnumWindows(_callback, matches)
-    return matches[0] if matches else None
+    if not matches:
+        return None
+
+    _CACHED_HWND, _CACHED_PID = matches[0]
+    _CACHED_NAME = process_name.lower()
+    return _CACHED_HWND
+
+
+# Upper bound and polling step for waiting on a focus change. Polling beats a
+# flat sleep because in the common case (window already focused, or focus lands
+# within a frame or two) we return in well under 200ms.
+FOREGROUND_TIMEOUT = 0.2
+FOREGROUND_POLL_INTERVAL = 0.005
 
 
 def bring_to_foreground(hwnd: int) -> bool:
     """Bring the window to the foreground.
 
+    Returns immediately when the window already has focus; otherwise requests
+    focus and polls ``GetForegroundWindow`` until it lands or the timeout
+    expires, so callers never pay a fixed settle delay.
+
     Returns:
         True if successful, False otherwise.
     """
     try:
+        # Fast path: nothing to do if we already have focus.
+        if win32gui.GetForegroundWindow() == hwnd:
+            return True
+
         # First, restore the window if minimized
         if win32gui.IsIconic(hwnd):
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            time.sleep(0.1)
 
         # Try to set foreground
         win32gui.SetForegroundWindow(hwnd)
-        time.sleep(0.05)
 
-        # Verify it worked
+        # Poll for the focus change instead of sleeping a fixed interval.
+        deadline = time.monotonic() + FOREGROUND_TIMEOUT
+        while time.monotonic() < deadline:
+            if win32gui.GetForegroundWindow() == hwnd:
+                return True
+            time.sleep(FOREGROUND_POLL_INTERVAL)
         return win32gui.GetForegroundWindow() == hwnd
     except Exception:
         # Silently handle common SetForegroundWindow failures
@@ -98,12 +186,83 @@ def bring_to_foreground(hwnd: int) -> bool:
         return False
 
 
-def capture_window(hwnd: int) -> Tuple[np.ndarray, Tuple[int, int]]:
-    """Capture the client area of the window as a BGR numpy array.
+# Capture backend selection: "dxcam" uses Windows Desktop Duplication via the
+# optional dxcam package (frames come straight from the GPU compositor, no GDI
+# readback), "mss" is the portable GDI path. "auto" prefers dxcam if installed.
+CAPTURE_BACKEND = os.environ.get("CAPTURE_BACKEND", "auto")
+
+# Persistent MSS instance: creating one per capture allocates and tears down
+# a GDI DC plus a compatible bitmap every frame. Guarded by a lock since MSS
+# instances are not thread-safe.
+_SCT: Optional[mss.mss] = None
+_SCT_LOCK = threading.Lock()
+_BGR_SCRATCH: Optional[np.ndarray] = None
+_GRAY_SCRATCH: Optional[np.ndarray] = None
+
+# Persistent dxcam camera, restarted only when the capture region changes.
+_CAMERA = None
+_CAMERA_REGION: Optional[Tuple[int, int, int, int]] = None
+
+# Last observed client-area size, used to invalidate the calibrated scale.
+_LAST_CLIENT_SIZE: Optional[Tuple[int, int]] = None
+
+
+def _use_dxcam() -> bool:
+    if dxcam is None:
+        return False
+    return CAPTURE_BACKEND in ("dxcam", "auto")
+
+
+def _capture_dxcam(bbox: dict) -> Optional[np.ndarray]:
+    """Grab a BGR frame via Desktop Duplication; None if unavailable."""
+    global _CAMERA, _CAMERA_REGION
+
+    region = (
+        bbox["left"],
+        bbox["top"],
+        bbox["left"] + bbox["width"],
+        bbox["top"] + bbox["height"],
+    )
+    try:
+        if _CAMERA is None:
+            _CAMERA = dxcam.create(output_idx=0, output_color="BGR")
+            if _CAMERA is None:
+                return None
+        if _CAMERA_REGION != region:
+            if _CAMERA_REGION is not None:
+                _CAMERA.stop()
+            # video_mode keeps frames flowing at target_fps even when the
+            # screen is static; without it get_latest_frame blocks until
+            # Desktop Duplication sees a change, hanging every probe on an
+            # idle menu or paused game.
+            _CAMERA.start(target_fps=60, region=region, video_mode=True)
+            _CAMERA_REGION = region
+        return _CAMERA.get_latest_frame()
+    except Exception:
+        # Desktop Duplication can fail (secure desktop, RDP, driver resets);
+        # the caller falls back to the MSS path.
+        return None
+
+
+def capture_window(
+    hwnd: int, channel: Optional[str] = None
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Capture the client area of the window as a numpy array.
+
+    Args:
+        hwnd: Window handle.
+        channel: "gray" or "bgr"; defaults to MATCH_CHANNEL. The gray path
+            converts the raw BGRA capture in a single cvtColor pass, never
+            materializing a BGR intermediate.
 
     Returns (image, (offset_x, offset_y)) where offset is the screen-space
     coordinate of the top-left corner of the captured client area.
+
+    The returned array is a reused scratch buffer: it stays valid until the
+    next capture_window call, which is all the probe loops need.
     """
+    if channel is None:
+        channel = MATCH_CHANNEL
 
     left, top, right, bottom = win32gui.GetClientRect(hwnd)
     if right - left == 0 or bottom - top == 0:
@@ -113,25 +272,129 @@ def capture_window(hwnd: int) -> Tuple[np.ndarray, Tuple[int, int]]:
     offset = win32gui.ClientToScreen(hwnd, (left, top))
     width, height = right - left, bottom - top
 
+    # A resized client area invalidates the calibrated template scale.
+    global _LAST_CLIENT_SIZE
+    if _LAST_CLIENT_SIZE != (width, height):
+        _LAST_CLIENT_SIZE = (width, height)
+        invalidate_scale()
+
     bbox = {"left": offset[0], "top": offset[1], "width": width, "height": height}
-    with mss.mss() as sct:
-        shot = sct.grab(bbox)
-    img = np.array(shot)
-    img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+
+    if _use_dxcam():
+        frame = _capture_dxcam(bbox)
+        if frame is not None:
+            # dxcam delivers BGR directly.
+            if channel == "gray":
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            return frame, (offset[0], offset[1])
+
+    global _SCT, _BGR_SCRATCH, _GRAY_SCRATCH
+    with _SCT_LOCK:
+        if _SCT is None:
+            _SCT = mss.mss()
+        shot = _SCT.grab(bbox)
+        # Wrap the raw BGRA buffer without copying, then convert straight
+        # into the preallocated scratch buffer for the requested channel
+        # (resized only when bbox changes).
+        arr = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4
+        )
+        if channel == "gray":
+            if _GRAY_SCRATCH is None or _GRAY_SCRATCH.shape != arr.shape[:2]:
+                _GRAY_SCRATCH = np.empty(arr.shape[:2], np.uint8)
+            img = cv2.cvtColor(arr, cv2.COLOR_BGRA2GRAY, dst=_GRAY_SCRATCH)
+        else:
+            if _BGR_SCRATCH is None or _BGR_SCRATCH.shape[:2] != arr.shape[:2]:
+                _BGR_SCRATCH = np.empty((shot.height, shot.width, 3), np.uint8)
+            img = cv2.cvtColor(arr, cv2.COLOR_BGRA2BGR, dst=_BGR_SCRATCH)
 
     return img, (offset[0], offset[1])
 
 
-def find_template_on_screen(
-    screen: np.ndarray,
-    template: np.ndarray,
-    threshold: float,
-    scales: Tuple[float, ...],
-) -> Optional[Tuple[int, int, int, int, float, float]]:
-    """Return (x, y, w, h, score, scale) of the best match if above threshold."""
+# Short-lived capture cache: during one workflow tick several checks probe
+# what is effectively the same frame back to back. Within the TTL they share
+# a single grab instead of re-blitting the window per probe. Keyed by
+# (hwnd, channel) since gray and BGR captures use different scratch buffers.
+SCREEN_CACHE_TTL = 0.15
+_SCREEN_CACHE: dict = {}
+# Bumped on every fresh capture; identifies a frame so callers can memoize
+# work derived from it (see functions._find_all) without hashing pixels.
+_CAPTURE_SEQ = 0
 
-    best = None
-    for scale in scales:
+
+def capture_window_cached(
+    hwnd: int, channel: Optional[str] = None, ttl: float = SCREEN_CACHE_TTL
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """capture_window with a short TTL cache shared across probes.
+
+    Anything that changes the screen (clicks go through click_screen, which
+    invalidates automatically) or that explicitly needs a fresh frame should
+    call invalidate_screen_cache first.
+    """
+    global _CAPTURE_SEQ
+    key = (hwnd, channel or MATCH_CHANNEL)
+    entry = _SCREEN_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1], entry[2]
+    screen, offset = capture_window(hwnd, channel)
+    _CAPTURE_SEQ += 1
+    _SCREEN_CACHE[key] = (time.monotonic(), screen, offset, _CAPTURE_SEQ)
+    return screen, offset
+
+
+def _capture_seq(hwnd: int, channel: Optional[str] = None) -> int:
+    """Sequence number of the cached frame for (hwnd, channel), 0 if none."""
+    entry = _SCREEN_CACHE.get((hwnd, channel or MATCH_CHANNEL))
+    return entry[3] if entry is not None else 0
+
+
+def invalidate_screen_cache() -> None:
+    """Drop cached captures so the next probe grabs a fresh frame."""
+    _SCREEN_CACHE.clear()
+
+
+def _prepare_frame(img: np.ndarray) -> np.ndarray:
+    """Convert a captured BGR frame to the configured match channel."""
+    if MATCH_CHANNEL == "gray" and img.ndim == 3:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    return img
+
+
+def _build_pyramid(img: np.ndarray, levels: int = PYRAMID_LEVELS) -> list[np.ndarray]:
+    """Build a Gaussian pyramid: element 0 is the original, each next is pyrDown'd."""
+    pyramid = [img]
+    for _ in range(levels - 1):
+        prev = pyramid[-1]
+        if min(prev.shape[:2]) // 2 < MIN_COARSE_SIDE:
+            break
+        pyramid.append(cv2.pyrDown(prev))
+    return pyramid
+
+
+@functools.lru_cache(maxsize=128)
+def _load_template(
+    template_path: str,
+) -> Optional[Tuple[np.ndarray, Tuple[Tuple[float, Tuple[np.ndarray, ...]], ...]]]:
+    """Load a template and precompute its multi-scale, multi-level pyramids.
+
+    Templates are immutable on disk, so the decoded BGR array, the resized
+    copy for every entry in SCALES, and the pyrDown levels used by the
+    coarse-to-fine search are all computed once and cached. This keeps disk
+    I/O and the ~13 resamples out of the hot probe loops.
+
+    Returns:
+        Tuple of (template, pyramid) where pyramid is a tuple of
+        (scale, levels) pairs — levels[0] is the full-resolution resized
+        template, each following entry is pyrDown'd once more — or None
+        if the image can't be read.
+    """
+    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
+    if template is None:
+        return None
+    template = _prepare_frame(template)
+
+    pyramid = []
+    for scale in SCALES:
         scaled = cv2.resize(
             template,
             dsize=None,
@@ -139,27 +402,549 @@ def find_template_on_screen(
             fy=scale,
             interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC,
         )
-        h, w = scaled.shape[:2]
-        if h > screen.shape[0] or w > screen.shape[1]:
-            continue
-        result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
+        pyramid.append((scale, tuple(_build_pyramid(scaled))))
+    return template, tuple(pyramid)
+
+
+class TemplateBank:
+    """Struct-of-arrays storage for one probe set's template pyramids.
+
+    _load_template leaves each scale's level arrays wherever the allocator
+    put them, so a batched probe walks N templates x 13 scales of scattered
+    heap blocks. The bank repacks every level of every template into a single
+    contiguous uint8 blob and rebuilds the pyramids as views into it — the
+    sweep then reads one straight stride the hardware prefetcher can follow,
+    and lookups cost a dict hit with zero per-call allocation.
+    """
+
+    __slots__ = ("data", "pyramids")
+
+    def __init__(self, template_paths: Tuple[str, ...]):
+        chunks: list[np.ndarray] = []
+        layout = []  # (path, template spec, [(scale, [level specs]), ...])
+        offset = 0
+
+        def pack(arr: np.ndarray) -> Tuple[int, Tuple[int, ...]]:
+            nonlocal offset
+            flat = arr.reshape(-1)
+            chunks.append(flat)
+            spec = (offset, arr.shape)
+            offset += flat.size
+            return spec
+
+        for path in template_paths:
+            loaded = _load_template(path)
+            if loaded is None:
+                layout.append((path, None, None))
+                continue
+            template, pyramid = loaded
+            scales = [
+                (scale, [pack(level) for level in levels]) for scale, levels in pyramid
+            ]
+            layout.append((path, pack(template), scales))
+
+        self.data = np.concatenate(chunks) if chunks else np.empty(0, np.uint8)
+
+        def view(spec: Tuple[int, Tuple[int, ...]]) -> np.ndarray:
+            start, shape = spec
+            size = int(np.prod(shape))
+            return self.data[start : start + size].reshape(shape)
+
+        self.pyramids: dict = {}
+        for path, template_spec, scales in layout:
+            if template_spec is None:
+                self.pyramids[path] = None
+                continue
+            pyramid = tuple(
+                (scale, tuple(view(spec) for spec in specs)) for scale, specs in scales
+            )
+            self.pyramids[path] = (view(template_spec), pyramid)
+
+    def get(self, path: str):
+        return self.pyramids.get(path)
+
+
+@functools.lru_cache(maxsize=64)
+def _template_bank(template_paths: Tuple[str, ...]) -> TemplateBank:
+    """Cached bank per probe set (probe sets are small and static in practice)."""
+    return TemplateBank(template_paths)
+
+
+def reload_templates() -> None:
+    """Drop all cached templates (e.g. after editing images in assets/)."""
+    _load_template.cache_clear()
+    _template_bank.cache_clear()
+
+
+# Shared worker pool for probing several template variants against one frame.
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+# Reused matchTemplate result buffers, keyed by output shape. Thread-local so
+# parallel variant probes never share a buffer.
+_TLS = threading.local()
+
+
+def _result_buffer(out_h: int, out_w: int) -> np.ndarray:
+    """Return a reusable float32 result buffer for the given output shape.
+
+    cv2.matchTemplate otherwise mallocs and frees a fresh (H-h+1, W-w+1)
+    float32 array per scale per probe — several MB each on a large frame.
+    """
+    buffers = getattr(_TLS, "result_buffers", None)
+    if buffers is None:
+        buffers = _TLS.result_buffers = {}
+    buf = buffers.get((out_h, out_w))
+    if buf is None:
+        buf = buffers[(out_h, out_w)] = np.empty((out_h, out_w), np.float32)
+    return buf
+
+
+def _match_template_spatial(img: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """cv2.matchTemplate into a preallocated result buffer."""
+    out_h = img.shape[0] - template.shape[0] + 1
+    out_w = img.shape[1] - template.shape[1] + 1
+    buf = _result_buffer(out_h, out_w)
+    return cv2.matchTemplate(img, template, cv2.TM_CCOEFF_NORMED, result=buf)
+
+
+# Opt-in OpenCL matching via the transparent API: wrapping inputs in cv2.UMat
+# makes matchTemplate dispatch to the GPU's OpenCL kernel, which wins on
+# integrated GPUs once frames are large. Off by default because the first
+# kernel compile stalls for a second and weak drivers can be slower than the
+# CPU FFT path — set USE_OPENCL=1 to enable.
+USE_OPENCL = os.environ.get("USE_OPENCL", "0").lower() in ("1", "true", "yes")
+_OPENCL_OK = bool(USE_OPENCL and hasattr(cv2, "ocl") and cv2.ocl.haveOpenCL())
+if _OPENCL_OK:
+    cv2.ocl.setUseOpenCL(True)
+
+# Cached GPU uploads of long-lived template arrays, keyed like
+# _TEMPLATE_SPECTRA below (the value pins the source array).
+_TEMPLATE_UMATS: dict = {}
+
+
+def _template_umat(template: np.ndarray) -> "cv2.UMat":
+    key = (template.ctypes.data, template.shape)
+    entry = _TEMPLATE_UMATS.get(key)
+    if entry is None:
+        entry = _TEMPLATE_UMATS[key] = (cv2.UMat(template), template)
+    return entry[0]
+
+
+def _match_template_opencl(img: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """matchTemplate through the T-API; templates stay resident on the GPU."""
+    result = cv2.matchTemplate(
+        cv2.UMat(img), _template_umat(template), cv2.TM_CCOEFF_NORMED
+    )
+    return result.get()
+
+
+# Cached template spectra keyed by (data pointer, shape, dft size). The value
+# pins the template array so the pointer can't be recycled while cached.
+_TEMPLATE_SPECTRA: dict = {}
+
+
+class _FrameTransform:
+    """Cached per-frame DFT spectra and integral images for FFT-based NCC.
+
+    Direct NCC is O(W·H·w·h) per template; DFT-domain cross-correlation is
+    O(W·H·log(W·H)) independent of template size. Build one transform per
+    captured frame (or pyramid level) and reuse it across every template
+    matched against that frame — the screen-side DFT and integral images
+    are paid once.
+    """
+
+    __slots__ = ("height", "width", "dft_h", "dft_w", "spectra", "win_sums", "win_sq")
+
+    def __init__(self, img: np.ndarray):
+        self.height, self.width = img.shape[:2]
+        self.dft_h = cv2.getOptimalDFTSize(self.height + FFT_MAX_SIDE - 1)
+        self.dft_w = cv2.getOptimalDFTSize(self.width + FFT_MAX_SIDE - 1)
+
+        channels = cv2.split(img.astype(np.float32))
+        self.spectra = []
+        self.win_sums = []
+        self.win_sq = []
+        for ch in channels:
+            padded = np.zeros((self.dft_h, self.dft_w), np.float32)
+            padded[: self.height, : self.width] = ch
+            self.spectra.append(cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT))
+            self.win_sums.append(cv2.integral(ch))
+            self.win_sq.append(cv2.integral(ch * ch))
+
+    def _window_sums(self, integral: np.ndarray, h: int, w: int) -> np.ndarray:
+        """Sliding-window sums over all (h, w) windows via the integral image."""
+        return (
+            integral[h:, w:]
+            - integral[:-h, w:]
+            - integral[h:, :-w]
+            + integral[:-h, :-w]
+        )
+
+    def _template_spectrum(self, template: np.ndarray):
+        """Per-channel spectra of the mean-subtracted, zero-padded template."""
+        key = (template.ctypes.data, template.shape, self.dft_h, self.dft_w)
+        cached = _TEMPLATE_SPECTRA.get(key)
+        if cached is not None:
+            return cached[1], cached[2]
+
+        channels = cv2.split(template.astype(np.float32))
+        spectra = []
+        t0_sq_sum = 0.0
+        for ch in channels:
+            t0 = ch - ch.mean()
+            t0_sq_sum += float((t0 * t0).sum())
+            padded = np.zeros((self.dft_h, self.dft_w), np.float32)
+            padded[: template.shape[0], : template.shape[1]] = t0
+            spectra.append(cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT))
+
+        _TEMPLATE_SPECTRA[key] = (template, spectra, t0_sq_sum)
+        return spectra, t0_sq_sum
+
+    def match(self, template: np.ndarray) -> np.ndarray:
+        """Compute the TM_CCOEFF_NORMED result map via DFT correlation."""
+        h, w = template.shape[:2]
+        out_h = self.height - h + 1
+        out_w = self.width - w + 1
+        tpl_spectra, t0_sq_sum = self._template_spectrum(template)
+
+        # Numerator: sum over channels of CCORR(I_c, T_c - mean(T_c)).
+        numerator = np.zeros((out_h, out_w), np.float32)
+        for spec, tpl_spec in zip(self.spectra, tpl_spectra):
+            cross = cv2.mulSpectrums(spec, tpl_spec, 0, conjB=True)
+            corr = cv2.idft(cross, flags=cv2.DFT_SCALE | cv2.DFT_REAL_OUTPUT)
+            numerator += corr[:out_h, :out_w]
+
+        # Denominator: sqrt(sum(T0²) · per-window variance sum of the image).
+        n = float(h * w)
+        variance = np.zeros((out_h, out_w), np.float64)
+        for integral, integral_sq in zip(self.win_sums, self.win_sq):
+            sums = self._window_sums(integral, h, w)
+            variance += self._window_sums(integral_sq, h, w) - sums * sums / n
+        denominator = np.sqrt(np.maximum(variance, 0.0) * t0_sq_sum)
+
+        result = np.zeros((out_h, out_w), np.float32)
+        np.divide(numerator, denominator, out=result, where=denominator > 1e-6)
+        return result
+
+
+def _match_template(
+    img: np.ndarray,
+    template: np.ndarray,
+    frame: Optional[_FrameTransform] = None,
+) -> np.ndarray:
+    """Match one template, using the frame's cached DFT path when it pays off."""
+    if _OPENCL_OK:
+        return _match_template_opencl(img, template)
+    h, w = template.shape[:2]
+    if frame is not None and max(h, w) >= FFT_MIN_SIDE and max(h, w) <= FFT_MAX_SIDE:
+        return frame.match(template)
+    return _match_template_spatial(img, template)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _zncc_small_kernel(src: np.ndarray, tpl: np.ndarray) -> np.ndarray:
+        """Hand-rolled ZNCC (TM_CCOEFF_NORMED) for small single-channel inputs.
+
+        For tiny ROI-sized matches the generic cv2.matchTemplate pays more
+        in dispatch and FFT-crossover heuristics than in arithmetic; these
+        explicit loops LLVM-vectorize and allocate nothing but the output.
+        """
+        th, tw = tpl.shape
+        n = th * tw
+        tpl_sum = 0.0
+        tpl_sq = 0.0
+        for i in range(th):
+            for j in range(tw):
+                v = np.float64(tpl[i, j])
+                tpl_sum += v
+                tpl_sq += v * v
+        tpl_mean = tpl_sum / n
+        tpl_var = tpl_sq - tpl_sum * tpl_mean
+
+        out_h = src.shape[0] - th + 1
+        out_w = src.shape[1] - tw + 1
+        out = np.empty((out_h, out_w), np.float32)
+        for y in range(out_h):
+            for x in range(out_w):
+                win_sum = 0.0
+                win_sq = 0.0
+                cross = 0.0
+                for i in range(th):
+                    for j in range(tw):
+                        v = np.float64(src[y + i, x + j])
+                        win_sum += v
+                        win_sq += v * v
+                        cross += v * tpl[i, j]
+                numerator = cross - win_sum * tpl_mean
+                denominator = (win_sq - win_sum * win_sum / n) * tpl_var
+                if denominator > 1e-12:
+                    out[y, x] = np.float32(numerator / np.sqrt(denominator))
+                else:
+                    out[y, x] = 0.0
+        return out
+
+else:
+    _zncc_small_kernel = None
+
+
+def _match_small(img: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """NCC for small single-channel matches, jitted when numba is installed."""
+    if (
+        _zncc_small_kernel is not None
+        and img.ndim == 2
+        and max(template.shape[:2]) <= NUMBA_MAX_SIDE
+    ):
+        return _zncc_small_kernel(img, template)
+    return _match_template_spatial(img, template)
+
+
+def _match_in_roi(
+    level_img: np.ndarray,
+    template: np.ndarray,
+    x: int,
+    y: int,
+) -> Optional[Tuple[int, int, float]]:
+    """Run matchTemplate in a small window around (x, y) at one pyramid level.
+
+    Returns (x, y, score) of the best match within the window, in the
+    level's own coordinates, or None if the template doesn't fit.
+    """
+    img_h, img_w = level_img.shape[:2]
+    h, w = template.shape[:2]
+    if h > img_h or w > img_w:
+        return None
+
+    x0 = min(max(0, x - REFINE_MARGIN), img_w - w)
+    y0 = min(max(0, y - REFINE_MARGIN), img_h - h)
+    x1 = min(img_w, x + w + REFINE_MARGIN)
+    y1 = min(img_h, y + h + REFINE_MARGIN)
+
+    roi = level_img[y0:y1, x0:x1]
+    result = _match_small(roi, template)
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return x0 + max_loc[0], y0 + max_loc[1], max_val
+
+
+# Scale calibrated for the current session. The client window rarely changes
+# size mid-session, so once any template matches, only that scale is probed
+# until it stops matching (or the client rect changes, see capture_window).
+_ACTIVE_SCALE: Optional[float] = None
+
+
+def invalidate_scale() -> None:
+    """Forget the calibrated scale (forces a full sweep on the next probe)."""
+    global _ACTIVE_SCALE
+    _ACTIVE_SCALE = None
+
+
+def calibrate_scale(
+    template_path: str,
+    process_name: str = PROCESS_NAME,
+    threshold: float = MATCH_THRESHOLD,
+) -> Optional[float]:
+    """Pin the session scale by running a full sweep on a landmark template.
+
+    Args:
+        template_path: A template that is known to be on screen right now
+            (e.g. the is_in_garden landmark).
+        process_name: Name of the process to find (default: PROCESS_NAME)
+        threshold: Match threshold (default: MATCH_THRESHOLD)
+
+    Returns:
+        The calibrated scale, or None if the landmark was not found.
+    """
+    invalidate_scale()
+    match = probe_many([template_path], process_name, threshold).get(template_path)
+    if match is None:
+        return None
+    return match[5]
+
+
+def find_template_on_screen(
+    screen: np.ndarray,
+    pyramid: Tuple[Tuple[float, Tuple[np.ndarray, ...]], ...],
+    threshold: float,
+) -> Optional[Tuple[int, int, int, int, float, float]]:
+    """Return (x, y, w, h, score, scale) of the best match if above threshold.
+
+    When a session scale has been calibrated (by any previous successful
+    match), only that scale is probed; the full sweep runs as a fallback
+    and re-calibrates on success.
+
+    Args:
+        screen: Captured window image.
+        pyramid: Precomputed (scale, levels) pairs from _load_template.
+        threshold: Match threshold.
+    """
+    global _ACTIVE_SCALE
+
+    if _ACTIVE_SCALE is not None:
+        subset = tuple(entry for entry in pyramid if entry[0] == _ACTIVE_SCALE)
+        if subset:
+            match = _search_scales(screen, subset, threshold)
+            if match is not None:
+                return match
+
+    match = _search_scales(screen, pyramid, threshold)
+    if match is not None:
+        _ACTIVE_SCALE = match[5]
+    return match
+
+
+def _search_scales(
+    screen: np.ndarray,
+    pyramid: Tuple[Tuple[float, Tuple[np.ndarray, ...]], ...],
+    threshold: float,
+) -> Optional[Tuple[int, int, int, int, float, float]]:
+    """Coarse-to-fine pyramid search over the given scale set.
+
+    The full multi-scale sweep runs only on a pyrDown'd copy of the screen,
+    then the winning candidates are refined level by level inside a small
+    ROI around the upscaled peak. This avoids full-frame NCC at native
+    resolution for every scale.
+    """
+
+    screen_pyramid = _build_pyramid(screen)
+    frames: dict[int, _FrameTransform] = {}  # Lazy per-level DFT transforms.
+
+    # Pick each scale's coarsest usable pyramid level.
+    sweep = []  # (scale, levels, depth)
+    for scale, levels in pyramid:
+        depth = min(len(levels), len(screen_pyramid)) - 1
+        while depth >= 0:
+            template = levels[depth]
+            coarse = screen_pyramid[depth]
+            if (
+                template.shape[0] <= coarse.shape[0]
+                and template.shape[1] <= coarse.shape[1]
+            ):
+                break
+            depth -= 1
+        if depth >= 0:
+            sweep.append((scale, levels, depth))
+
+    # SQDIFF prefilter: integer sum-of-squared-differences is several times
+    # cheaper than normalized correlation at the same resolution, so on a wide
+    # sweep rank the scales by their per-pixel SQDIFF minimum first and run the
+    # exact NCC pass only on the survivors. Acceptance still rests solely on
+    # the full-resolution NCC score in the fine pass below.
+    if len(sweep) > PREFILTER_KEEP:
+        ranked = []
+        for scale, levels, depth in sweep:
+            template = levels[depth]
+            out_h = screen_pyramid[depth].shape[0] - template.shape[0] + 1
+            out_w = screen_pyramid[depth].shape[1] - template.shape[1] + 1
+            result = cv2.matchTemplate(
+                screen_pyramid[depth],
+                template,
+                cv2.TM_SQDIFF,
+                result=_result_buffer(out_h, out_w),
+            )
+            min_val = cv2.minMaxLoc(result)[0]
+            ranked.append((min_val / template.size, scale, levels, depth))
+        ranked.sort(key=lambda r: r[0])
+        sweep = [entry[1:] for entry in ranked[:PREFILTER_KEEP]]
+
+    # Coarse pass: exact NCC for the surviving scales at their coarse level.
+    candidates = []  # (score, x, y, depth, scale, levels)
+    for scale, levels, depth in sweep:
+        template = levels[depth]
+        if max(template.shape[:2]) >= FFT_MIN_SIDE and depth not in frames:
+            frames[depth] = _FrameTransform(screen_pyramid[depth])
+        result = _match_template(screen_pyramid[depth], template, frames.get(depth))
         _, max_val, _, max_loc = cv2.minMaxLoc(result)
-        if best is None or max_val > best[0]:
-            best = (max_val, max_loc, w, h, scale)
+        candidates.append((max_val, max_loc[0], max_loc[1], depth, scale, levels))
+
+    if not candidates:
+        return None
+
+    # Fine pass: walk the best-ranked candidates down to full resolution,
+    # re-matching in a small ROI around the peak propagated from the coarser
+    # level. Coarse scores only rank candidates (pyrDown misalignment can
+    # depress them or favor a neighboring scale); acceptance is decided by
+    # the exact full-resolution score.
+    candidates.sort(key=lambda c: c[0], reverse=True)
+    best = None
+    for score, x, y, depth, scale, levels in candidates[:REFINE_CANDIDATES]:
+        for level in range(depth - 1, -1, -1):
+            x, y = x * 2, y * 2
+            refined = _match_in_roi(screen_pyramid[level], levels[level], x, y)
+            if refined is None:
+                score = None
+                break
+            x, y, score = refined
+        if score is None:
+            continue
+        if best is None or score > best[0]:
+            h, w = levels[0].shape[:2]
+            best = (score, x, y, w, h, scale)
 
     if best is None or best[0] < threshold:
         return None
 
-    max_val, max_loc, w, h, scale = best
-    return max_loc[0], max_loc[1], w, h, max_val, scale
+    score, x, y, w, h, scale = best
+    return x, y, w, h, score, scale
+
+
+# SendInput plumbing for click_screen. Batching move + down + up into one
+# INPUT array means a single user/kernel transition instead of three, and the
+# kernel injects the sequence atomically — the button-down can never race
+# ahead of the cursor move the way the legacy SetCursorPos/mouse_event trio
+# occasionally did.
+_INPUT_MOUSE = 0
+_MOUSEEVENTF_MOVE = 0x0001
+_MOUSEEVENTF_ABSOLUTE = 0x8000
+_ABSOLUTE_RANGE = 65535  # Absolute coords are normalized to a 0..65535 grid.
+_SM_CXSCREEN = 0
+_SM_CYSCREEN = 1
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest member of the INPUT union, so declaring only
+    # it keeps the struct layout (and sizeof) identical to the C definition.
+    _fields_ = [
+        ("type", ctypes.c_ulong),
+        ("mi", _MOUSEINPUT),
+    ]
 
 
 def click_screen(x: int, y: int) -> None:
-    """Simulate a left mouse click at screen coordinates."""
+    """Simulate a left mouse click at screen coordinates.
 
-    win32api.SetCursorPos((x, y))
-    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
+    The cursor move and both button transitions go out in one SendInput
+    call rather than three separate Win32 calls.
+    """
+    user32 = ctypes.windll.user32
+    screen_w = user32.GetSystemMetrics(_SM_CXSCREEN) or 1
+    screen_h = user32.GetSystemMetrics(_SM_CYSCREEN) or 1
+    nx = x * _ABSOLUTE_RANGE // screen_w
+    ny = y * _ABSOLUTE_RANGE // screen_h
+
+    invalidate_screen_cache()  # The click is about to change what's on screen.
+
+    inputs = (_INPUT * 3)()
+    flags = (
+        _MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE,
+        win32con.MOUSEEVENTF_LEFTDOWN,
+        win32con.MOUSEEVENTF_LEFTUP,
+    )
+    for entry, flag in zip(inputs, flags):
+        entry.type = _INPUT_MOUSE
+        entry.mi = _MOUSEINPUT(nx, ny, 0, flag, 0, 0)
+    user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
 
 
 def get_template_location(
@@ -182,14 +967,14 @@ def get_template_location(
         return None
 
     bring_to_foreground(hwnd)
-    time.sleep(0.1)
 
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
+    loaded = _load_template(template_path)
+    if loaded is None:
         return None
+    _, pyramid = loaded
 
-    screen, offset = capture_window(hwnd)
-    match = find_template_on_screen(screen, template, threshold, tuple(SCALES))
+    screen, offset = capture_window_cached(hwnd)
+    match = find_template_on_screen(screen, pyramid, threshold)
 
     if match is None:
         return None
@@ -222,29 +1007,24 @@ def find_all_template_locations(
         return []
 
     bring_to_foreground(hwnd)
-    time.sleep(0.1)
 
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
+    loaded = _load_template(template_path)
+    if loaded is None:
         return []
+    _, pyramid = loaded
 
-    screen, offset = capture_window(hwnd)
+    screen, offset = capture_window_cached(hwnd)
     locations = []
+    frame = _FrameTransform(screen)  # One screen DFT shared across all scales.
 
     # Try all scales and collect matches
-    for scale in SCALES:
-        scaled = cv2.resize(
-            template,
-            dsize=None,
-            fx=scale,
-            fy=scale,
-            interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC,
-        )
+    for scale, levels in pyramid:
+        scaled = levels[0]
         h, w = scaled.shape[:2]
         if h > screen.shape[0] or w > screen.shape[1]:
             continue
 
-        result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
+        result = _match_template(screen, scaled, frame)
         loc = np.where(result >= threshold)
 
         for pt in zip(*loc[::-1]):
@@ -262,69 +1042,135 @@ def find_all_template_locations(
     return locations
 
 
-def locate_and_click(
-    template_path: str,
+def _crop_roi(
+    screen: np.ndarray,
+    roi: Optional[Tuple[float, float, float, float]],
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Slice a normalized (x, y, w, h) ROI out of the screen.
+
+    Returns (view, (offset_x, offset_y)) where the offset maps ROI-local
+    coordinates back into full-frame client coordinates. A None ROI returns
+    the full screen with a zero offset.
+    """
+    if roi is None:
+        return screen, (0, 0)
+
+    height, width = screen.shape[:2]
+    x0 = max(0, min(width, int(roi[0] * width)))
+    y0 = max(0, min(height, int(roi[1] * height)))
+    x1 = max(x0, min(width, x0 + int(roi[2] * width)))
+    y1 = max(y0, min(height, y0 + int(roi[3] * height)))
+    return screen[y0:y1, x0:x1], (x0, y0)
+
+
+def _probe_screen(
+    screen: np.ndarray,
+    template_paths: list[str],
+    threshold: float,
+    roi: Optional[Tuple[float, float, float, float]] = None,
+) -> dict[str, Optional[Tuple[int, int, int, int, float, float]]]:
+    """Match every template against one already-captured frame.
+
+    Args:
+        screen: Captured window image.
+        template_paths: Paths to the template image files.
+        threshold: Match threshold.
+        roi: Optional normalized (x, y, w, h) region to restrict the search;
+            a 25%x25% ROI cuts matchTemplate work by 16x.
+
+    Returns:
+        Dict mapping template_path to (x, y, w, h, score, scale) in client
+        coordinates, or None for templates that were not found / unreadable.
+    """
+    search_area, (roi_x, roi_y) = _crop_roi(screen, roi)
+
+    results: dict[str, Optional[Tuple[int, int, int, int, float, float]]] = {}
+    pyramids: dict[str, Tuple] = {}
+    bank = _template_bank(tuple(template_paths))
+    for template_path in template_paths:
+        loaded = bank.get(template_path)
+        if loaded is None:
+            print(f"[warn] Could not read template image: {template_path}")
+            results[template_path] = None
+            continue
+        pyramids[template_path] = loaded[1]
+
+    if len(pyramids) > 1:
+        # matchTemplate releases the GIL, so variants run concurrently.
+        futures = {
+            path: _POOL.submit(find_template_on_screen, search_area, pyramid, threshold)
+            for path, pyramid in pyramids.items()
+        }
+        matches = {path: future.result() for path, future in futures.items()}
+    else:
+        matches = {
+            path: find_template_on_screen(search_area, pyramid, threshold)
+            for path, pyramid in pyramids.items()
+        }
+
+    for template_path, match in matches.items():
+        if match is not None and (roi_x or roi_y):
+            x, y, w, h, score, scale = match
+            match = (x + roi_x, y + roi_y, w, h, score, scale)
+        results[template_path] = match
+    return results
+
+
+def probe_many(
+    template_paths: list[str],
     process_name: str = PROCESS_NAME,
     threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate the template in the process window and click it.
+    roi: Optional[Tuple[float, float, float, float]] = None,
+) -> dict[str, Optional[Tuple[int, int, int, int, float, float]]]:
+    """Probe several templates against a single window capture.
+
+    Captures the window once and matches every template against the same
+    frame, so N probes cost one capture instead of N.
 
     Args:
-        template_path: Path to the template image file
+        template_paths: Paths to the template image files
         process_name: Name of the process to find (default: PROCESS_NAME)
         threshold: Match threshold (default: MATCH_THRESHOLD)
 
     Returns:
-        True on success, False otherwise.
+        Dict mapping template_path to (x, y, w, h, score, scale) or None.
+        Empty dict if the window was not found.
     """
-
     hwnd = find_window_for_process(process_name)
     if hwnd is None:
         print(f"[error] No window found for process '{process_name}'.")
-        return False
+        return {}
 
-    # Try to bring to foreground (may fail, but continue anyway)
     bring_to_foreground(hwnd)
-    time.sleep(0.2)  # Allow focus to settle.
 
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
-        print(f"[error] Could not read template image: {template_path}")
-        return False
-
-    screen, offset = capture_window(hwnd)
+    screen, offset = capture_window_cached(hwnd)
+    return _probe_screen(screen, template_paths, threshold, roi)
 
-    # Debug: Save screenshot if enabled
-    if DEBUG_SAVE_SCREENSHOTS:
-        from pathlib import Path
 
-        debug_dir = Path("debug_screenshots")
-        debug_dir.mkdir(exist_ok=True)
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        template_name = Path(template_path).stem
-        screenshot_path = debug_dir / f"{timestamp}_{template_name}_screen.png"
-        cv2.imwrite(str(screenshot_path), screen)
-        print(f"[debug] Saved screenshot to {screenshot_path}")
+def locate_and_click(
+    template_path: str,
+    process_name: str = PROCESS_NAME,
+    threshold: float = MATCH_THRESHOLD,
+    roi: Optional[Tuple[float, float, float, float]] = None,
+) -> bool:
+    """Locate the template in the process window and click it.
 
-    match = find_template_on_screen(screen, template, threshold, tuple(SCALES))
-    if match is None:
-        # print(f"[error] Template not found (threshold={threshold}).")  # Commented out for cleaner output
-        return False
+    Args:
+        template_path: Path to the template image file
+        process_name: Name of the process to find (default: PROCESS_NAME)
+        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    x, y, w, h, score, scale = match
-    client_center = (x + w // 2, y + h // 2)
-    screen_center = win32gui.ClientToScreen(hwnd, client_center)
-    click_screen(screen_center[0], screen_center[1])
-    print(
-        f"[info] Clicked at client={client_center} screen={screen_center} score={score:.3f} scale={scale:.2f}."
-    )
-    return True
+    Returns:
+        True on success, False otherwise.
+    """
+    return locate_and_click_multi([template_path], process_name, threshold, roi)
 
 
 def check_exists(
     template_path: str,
     process_name: str = PROCESS_NAME,
     threshold: float = MATCH_THRESHOLD,
+    roi: Optional[Tuple[float, float, float, float]] = None,
 ) -> bool:
     """Check if the template exists in the process window without clicking.
 
@@ -336,38 +1182,18 @@ def check_exists(
     Returns:
         True if found, False otherwise.
     """
-
-    hwnd = find_window_for_process(process_name)
-    if hwnd is None:
-        return False
-
-    # Try to bring to foreground (may fail, but continue anyway)
-    bring_to_foreground(hwnd)
-    time.sleep(0.1)  # Brief pause for focus.
-
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
-        return False
-
-    screen, offset = capture_window(hwnd)
-    match = find_template_on_screen(screen, template, threshold, tuple(SCALES))
-
-    if match is not None:
-        x, y, w, h, score, scale = match
-        print(f"[info] Template found: score={score:.3f} scale={scale:.2f}")
-        return True
-
-    return False
+    return check_exists_multi([template_path], process_name, threshold, roi)
 
 
 def locate_and_click_multi(
     template_paths: list[str],
     process_name: str = PROCESS_NAME,
     threshold: float = MATCH_THRESHOLD,
+    roi: Optional[Tuple[float, float, float, float]] = None,
 ) -> bool:
     """Locate one of multiple template variants and click it.
 
-    Tries each template in order and clicks the first one found.
+    Probes all variants against a single capture and clicks the best match.
 
     Args:
         template_paths: List of paths to template image files (variants)
@@ -384,26 +1210,30 @@ def locate_and_click_multi(
         return False
 
     bring_to_foreground(hwnd)
-    time.sleep(0.2)  # Allow focus to settle.
 
-    screen, offset = capture_window(hwnd)
+    screen, offset = capture_window_cached(hwnd)
 
-    # Try each template variant
-    best_match = None
-    best_template_path = None
+    # Debug: Save screenshot if enabled
+    if DEBUG_SAVE_SCREENSHOTS:
+        from pathlib import Path
 
-    for template_path in template_paths:
-        template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-        if template is None:
-            print(f"[warn] Could not read template image: {template_path}")
-            continue
+        debug_dir = Path("debug_screenshots")
+        debug_dir.mkdir(exist_ok=True)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        template_name = Path(template_paths[0]).stem
+        screenshot_path = debug_dir / f"{timestamp}_{template_name}_screen.png"
+        cv2.imwrite(str(screenshot_path), screen)
+        print(f"[debug] Saved screenshot to {screenshot_path}")
 
-        match = find_template_on_screen(screen, template, threshold, tuple(SCALES))
-        if match is not None:
-            # Found a match
-            if best_match is None or match[4] > best_match[4]:  # Compare scores
-                best_match = match
-                best_template_path = template_path
+    results = _probe_screen(screen, template_paths, threshold, roi)
+
+    # Pick the best-scoring variant
+    best_match = None
+    best_template_path = None
+    for template_path, match in results.items():
+        if match is not None and (best_match is None or match[4] > best_match[4]):
+            best_match = match
+            best_template_path = template_path
 
     if best_match is None:
         print(f"[error] None of the template variants found (threshold={threshold}).")
@@ -423,6 +1253,7 @@ def check_exists_multi(
     template_paths: list[str],
     process_name: str = PROCESS_NAME,
     threshold: float = MATCH_THRESHOLD,
+    roi: Optional[Tuple[float, float, float, float]] = None,
 ) -> bool:
     """Check if one of multiple template variants exists without clicking.
 
@@ -440,17 +1271,11 @@ def check_exists_multi(
         return False
 
     bring_to_foreground(hwnd)
-    time.sleep(0.1)  # Brief pause for focus.
 
-    screen, offset = capture_window(hwnd)
+    screen, offset = capture_window_cached(hwnd)
+    results = _probe_screen(screen, template_paths, threshold, roi)
 
-    # Try each template variant
-    for template_path in template_paths:
-        template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-        if template is None:
-            continue
-
-        match = find_template_on_screen(screen, template, threshold, tuple(SCALES))
+    for template_path, match in results.items():
         if match is not None:
             x, y, w, h, score, scale = match
             print(
@@ -463,3 +1288,14 @@ def check_exists_multi(
 
 # Initialize DPI awareness when module is imported
 set_dpi_awareness()
+
+# Pin OpenCV's threading up front: setNumThreads sizes the parallel_for_ pool
+# once instead of letting every matchTemplate re-negotiate it, and half the
+# cores leaves headroom for our own variant-probe pool. The throwaway match
+# spins the pool up and populates the dispatch/IPP caches so the first real
+# probe doesn't pay the warm-up latency.
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+cv2.matchTemplate(
+    np.zeros((64, 64), np.uint8), np.zeros((16, 16), np.uint8), cv2.TM_CCOEFF_NORMED
+)
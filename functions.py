@@ -3,6 +3,11 @@
 Each function corresponds to a specific template image and provides
 a convenient way to locate and click that template in the target window.
 
+The simple one-template wrappers are generated from the TEMPLATES table
+below: paths are resolved to strings once at import time instead of
+rebuilding a Path per call, and adding a new template is a one-line table
+entry rather than a copy-pasted function.
+
 Usage:
     from functions import button_shouhuo, icon_shouhuo
 
@@ -13,7 +18,16 @@ Usage:
     icon_shouhuo(threshold=0.7)
 """
 
+import os
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+
+import cv2
+import numpy as np
+
 from core import (
     locate_and_click,
     check_exists,
@@ -21,6 +35,9 @@ from core import (
     check_exists_multi,
     PROCESS_NAME,
     MATCH_THRESHOLD,
+    SCALES,
+    PYRAMID_LEVELS,
+    MIN_COARSE_SIDE,
 )
 
 
@@ -28,157 +45,453 @@ from core import (
 ASSETS_DIR = Path(__file__).parent / "assets"
 
 
-# ============================================================================
-# Button Functions
-# ============================================================================
-
-
-def button_luxiaohuiting(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'luxiaohuiting' button (supports two variants).
-
-    This function supports two variants of the button:
-    - luxiaohuiting.png (normal state)
-    - luxiaohuiting_gantanhao.png (with exclamation mark)
+@lru_cache(maxsize=None)
+def _get_template_pyramid(template_path: str, mtime: float):
+    """Decode a template once, resize across SCALES and pyrDown each copy.
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
+    The pot-detection helpers otherwise re-run cv2.imread plus thirteen
+    resizes for every template on every invocation of the monitor loop.
+    Keyed by mtime so editing a template on disk invalidates its entry.
 
-    Returns:
-        True on success, False otherwise.
+    Returns a list with one entry per scale; each entry is a list of pyramid
+    levels where element 0 is the full-resolution resized template and each
+    following element is pyrDown'd once more (for the coarse-to-fine search).
     """
-    template_paths = [
-        str(ASSETS_DIR / "button" / "luxiaohuiting.png"),
-        str(ASSETS_DIR / "button" / "luxiaohuiting_gantanhao.png"),
-    ]
-    return locate_and_click_multi(template_paths, process_name, threshold)
+    template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+    if template is None:
+        return None
+
+    pyramids = []
+    for scale in SCALES:
+        scaled = cv2.resize(
+            template,
+            dsize=None,
+            fx=scale,
+            fy=scale,
+            interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC,
+        )
+        levels = [scaled]
+        for _ in range(PYRAMID_LEVELS - 1):
+            if min(levels[-1].shape[:2]) // 2 < MIN_COARSE_SIDE:
+                break
+            levels.append(cv2.pyrDown(levels[-1]))
+        pyramids.append(levels)
+    return pyramids
 
 
-def button_shouhuo(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'shouhuo' button.
+def _scaled_templates(template_path: str):
+    """Cached pre-scaled copies of a template, or None if unreadable."""
+    try:
+        mtime = os.path.getmtime(template_path)
+    except OSError:
+        return None
+    return _get_template_pyramid(template_path, mtime)
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    Returns:
-        True on success, False otherwise.
+@lru_cache(maxsize=8)
+def _list_templates(directory: str, mtime: float) -> tuple:
+    """Cached sorted *.png listing, keyed by the directory's mtime.
+
+    Adding or removing a template bumps the directory mtime and invalidates
+    the entry; in-place edits are covered by _scaled_templates' file-mtime key.
     """
-    template_path = str(ASSETS_DIR / "button" / "shouhuo.png")
-    return locate_and_click(template_path, process_name, threshold)
+    return tuple(sorted(str(p) for p in Path(directory).glob("*.png")))
 
 
-def button_zhongzhi(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'zhongzhi' button.
+def _seedling_templates() -> tuple:
+    """Seedling template paths, re-globbed only when the directory changes."""
+    seedling_dir = ASSETS_DIR / "is_not_empty_huapen"
+    try:
+        mtime = seedling_dir.stat().st_mtime
+    except OSError:
+        return ()
+    return _list_templates(str(seedling_dir), mtime)
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    Returns:
-        True on success, False otherwise.
+def _prewarm_template_cache() -> None:
+    """Decode and pre-scale the pot-detection templates at import time.
+
+    These are the templates the monitor loop hammers; warming them here keeps
+    the decode/resize burst out of the first iteration.
     """
-    template_path = str(ASSETS_DIR / "button" / "zhongzhi.png")
-    return locate_and_click(template_path, process_name, threshold)
+    paths = [str(ASSETS_DIR / "item" / "konghuapen.png")]
+    paths.extend(_seedling_templates())
+    for path in paths:
+        _scaled_templates(path)
 
+    # Execute the numba kernel once here, on the main thread: its
+    # parallel runtime must not be initialized from a thread-pool worker,
+    # or interpreter shutdown deadlocks. This also folds the JIT compile
+    # (or cache load) into import instead of the first scan.
+    from functions_numba import zncc_small
 
-def button_return(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'return' button.
+    if zncc_small is not None:
+        zncc_small(np.zeros((8, 8), np.float32), np.ones((4, 4), np.float32))
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    Returns:
-        True on success, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "button" / "return.png")
-    return locate_and_click(template_path, process_name, threshold)
+_prewarm_template_cache()
 
 
-# ============================================================================
-# Icon Functions
-# ============================================================================
+# Normalized (x, y, w, h) search regions for templates that always appear in
+# the same part of the window. Restricting the search area cuts matchTemplate
+# work proportionally (a quarter-sized ROI is a 16x reduction).
+ROI_GARDEN_RETURN = (0.0, 0.85, 0.2, 0.15)  # Bottom-left corner.
+# Pots only appear in the garden play area, never over the top HUD strip or
+# the very bottom edge; cropping before the scan cuts NCC work by the area
+# ratio. Widen if the garden layout changes.
+ROI_GARDEN = (0.0, 0.08, 1.0, 0.87)
 
+# Squared proximity radii: every distance test compares against a constant,
+# so the square roots can be dropped from the hot loops.
+R30_SQ = 30 * 30  # Duplicate-detection radius.
+R80_SQ = 80 * 80  # A seedling within this radius marks a pot as occupied.
 
-def icon_shouhuo(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'shouhuo' icon.
+# The pot helpers force the game window to the foreground before capturing.
+# core.bring_to_foreground already polls instead of sleeping a flat 200 ms,
+# but workflows run several probes per tick, so remember when we last forced
+# it and skip even the call for a second afterwards.
+_FG_REFRESH_INTERVAL = 1.0
+_LAST_FG_TIME = 0.0
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    Returns:
-        True on success, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "shouhuo.png")
-    return locate_and_click(template_path, process_name, threshold)
+def _ensure_foreground(hwnd) -> None:
+    """Bring hwnd to the foreground at most once per _FG_REFRESH_INTERVAL."""
+    global _LAST_FG_TIME
+    import time
 
+    from core import bring_to_foreground
 
-def icon_garden_zhongzhi(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'garden_zhongzhi' icon.
+    now = time.monotonic()
+    if now - _LAST_FG_TIME < _FG_REFRESH_INTERVAL:
+        return
+    bring_to_foreground(hwnd)
+    _LAST_FG_TIME = time.monotonic()
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    Returns:
-        True on success, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "garden_zhongzhi.png")
-    return locate_and_click(template_path, process_name, threshold)
+# Shared pool for the coarse scans: cv2.matchTemplate and the DFT helpers
+# release the GIL, so scales within a depth group can run concurrently.
+# Sized to half the cores because core already gives OpenCV's internal pool
+# the other half — together they saturate the machine without oversubscribing.
+_SCAN_POOL = ThreadPoolExecutor(
+    max_workers=max(2, (os.cpu_count() or 2) // 2),
+    thread_name_prefix="scan",
+)
 
+# Numba's default threading layer is not safe for concurrent callers, and the
+# kernel is internally parallel anyway — serialize entry from the pool workers.
+_ZNCC_LOCK = threading.Lock()
+
+
+# Per-frame scan state for _find_all: the ROI-cropped frame's pyramid, its
+# per-depth DFT transforms, and the memoized hit lists. Single-slot on
+# purpose — capture_window reuses its scratch buffers, so only the most
+# recent frame's arrays are safe to keep referencing.
+_SCAN_STATE = {"key": None, "pyramid": None, "transforms": None, "results": None}
+
+# Last accepted hits per template, with the scaled template that matched at
+# each spot. Game UI re-renders pixel-identically frame after frame, so a
+# cheap SSD identity check at the old locations usually replaces the whole
+# pyramid search. Mean squared error per pixel allowed before falling back.
+_LAST_HITS: dict = {}
+_FAST_PATH_TOL = 2.0
+
+
+def _coarse_match(pyramid, transforms, depth, template):
+    """One coarse score map: Numba ZNCC, shared-DFT NCC, or plain matchTemplate."""
+    from core import _FrameTransform, FFT_MIN_SIDE, FFT_MAX_SIDE
+    from functions_numba import zncc_small
+
+    side = max(template.shape[:2])
+    if side < FFT_MIN_SIDE or side > FFT_MAX_SIDE:
+        # Below the FFT window the template is small enough for the
+        # row-parallel Numba scanner, which skips matchTemplate's
+        # dispatch overhead entirely.
+        if zncc_small is not None and side < FFT_MIN_SIDE:
+            with _ZNCC_LOCK:
+                return zncc_small(pyramid[depth], template)
+        return cv2.matchTemplate(pyramid[depth], template, cv2.TM_CCOEFF_NORMED)
+    frame = transforms.get(depth)
+    if frame is None:
+        frame = transforms[depth] = _FrameTransform(pyramid[depth])
+    return frame.match(template)
+
+
+def _find_all(screen, screen_id, template_path, thresh, method=cv2.TM_SQDIFF_NORMED):
+    """Find every match of template_path in the (ROI-cropped) gray frame.
+
+    screen_id is core's capture sequence number: it identifies the frame, so
+    the pyramid, the per-depth DFT transforms and the final hit lists are
+    memoized per frame. A checker probe followed by a clicker probe within
+    one screen-cache TTL repeats no OpenCV work at all.
+
+    Returns a tuple of (x, y, w, h) hits in frame coordinates.
+    """
+    state = _SCAN_STATE
+    state_key = (screen_id, screen.shape)
+    if state["key"] != state_key:
+        # Downsampled copies of the frame, shared by every template probed
+        # against this capture (the pot plus all seedling variants). The
+        # per-depth DFT transforms share the screen-side FFT and integral
+        # images the same way: paid once, reused per template.
+        pyramid = [screen]
+        for _ in range(PYRAMID_LEVELS - 1):
+            if min(pyramid[-1].shape[:2]) // 2 < MIN_COARSE_SIDE:
+                break
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+        state.update(key=state_key, pyramid=pyramid, transforms={}, results={})
+
+    memo_key = (template_path, thresh, method)
+    hits = state["results"].get(memo_key)
+    if hits is not None:
+        return hits
+
+    screen_pyramid = state["pyramid"]
+    frame_transforms = state["transforms"]
+
+    scaled_pyramids = _scaled_templates(template_path)
+    if scaled_pyramids is None:
+        return ()
+
+    # Fast path: if every hit from the previous frame is still pixel-identical
+    # (within tolerance), reuse it without searching. A hit appearing at a new
+    # location is only missed until something changes the old ones — and every
+    # click invalidates the screen cache anyway.
+    last = _LAST_HITS.get(template_path)
+    if last is not None:
+        last_hits, last_tpls = last
+        for (x, y, w, h), tpl in zip(last_hits, last_tpls):
+            roi = screen[y : y + tpl.shape[0], x : x + tpl.shape[1]]
+            if roi.shape != tpl.shape:
+                break
+            diff = roi.astype(np.int32) - tpl.astype(np.int32)
+            if int(np.einsum("ij,ij->", diff, diff)) > _FAST_PATH_TOL * tpl.size:
+                break
+        else:
+            state["results"][memo_key] = last_hits
+            return last_hits
+
+    # Group scales by their deepest usable pyramid level so each group's
+    # coarse score maps can be fused into one best-over-scales map.
+    by_depth = {}
+    for levels in scaled_pyramids:
+        h, w = levels[0].shape[:2]
+        if h > screen.shape[0] or w > screen.shape[1]:
+            continue
+        depth = min(len(levels), len(screen_pyramid)) - 1
+        while depth > 0 and (
+            levels[depth].shape[0] > screen_pyramid[depth].shape[0]
+            or levels[depth].shape[1] > screen_pyramid[depth].shape[1]
+        ):
+            depth -= 1
+        by_depth.setdefault(depth, []).append(levels)
+
+    locations = []
+    hit_templates = []
+
+    for depth, group in by_depth.items():
+        coarse = screen_pyramid[depth]
+        ref_h, ref_w = coarse.shape[:2]
+
+        # Coarse pass, fused over scales: each scale's score map is padded
+        # to the frame size and folded into a running np.maximum, with an
+        # index map recording which scale won each pixel. The relaxed
+        # threshold compensates for pyrDown misalignment depressing peak
+        # scores slightly.
+        best = np.full((ref_h, ref_w), -1.0, np.float32)
+        best_idx = np.zeros((ref_h, ref_w), np.intp)
+
+        # Run the per-scale matches on the shared pool; they only read the
+        # frame pyramid. The depth's _FrameTransform is seeded here, in the
+        # main thread, so the workers never race to build it.
+        if len(group) > 1:
+            from core import _FrameTransform, FFT_MIN_SIDE, FFT_MAX_SIDE
+
+            if depth not in frame_transforms and any(
+                FFT_MIN_SIDE <= max(levels[depth].shape[:2]) <= FFT_MAX_SIDE
+                for levels in group
+            ):
+                frame_transforms[depth] = _FrameTransform(coarse)
+            results = _SCAN_POOL.map(
+                lambda levels: _coarse_match(
+                    screen_pyramid, frame_transforms, depth, levels[depth]
+                ),
+                group,
+            )
+        else:
+            results = (
+                _coarse_match(screen_pyramid, frame_transforms, depth, levels[depth])
+                for levels in group
+            )
 
-def icon_garden_return(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'garden_return' icon.
+        for i, result in enumerate(results):
+            result = cv2.copyMakeBorder(
+                result,
+                0,
+                ref_h - result.shape[0],
+                0,
+                ref_w - result.shape[1],
+                cv2.BORDER_CONSTANT,
+                value=-1.0,
+            )
+            best_idx[result > best] = i
+            np.maximum(best, result, out=best)
+            # Scales run nearest-1.0 first; a confidently-above-threshold
+            # peak means the window's real scale is found and the remaining
+            # (mostly INTER_CUBIC-upsampled) hypotheses can only lose to it.
+            if result.max() >= thresh + 0.05:
+                break
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
+        coarse_thresh = max(0.5, thresh - 0.15) if depth else thresh
+
+        # Non-maximum suppression in C on the fused map: a location survives
+        # only if it holds the peak best-over-scales score of its
+        # neighborhood (the 30px dedup radius, shrunk to this pyramid
+        # level). This also replaces the order-dependent first-scale-wins
+        # dedup across scales.
+        ksize = max(3, (30 >> depth) | 1)
+        local_max = cv2.dilate(best, np.ones((ksize, ksize), np.uint8))
+        ys, xs = np.nonzero((best >= coarse_thresh) & (best >= local_max))
+
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            levels = group[best_idx[y, x]]
+            h, w = levels[0].shape[:2]
+            score = best[y, x]
+
+            # Refine the peak level by level inside a small ROI around the
+            # upsampled coordinates; only the full-resolution score decides
+            # acceptance.
+            for level in range(depth - 1, -1, -1):
+                x, y = x * 2, y * 2
+                lvl_img = screen_pyramid[level]
+                lvl_tpl = levels[level]
+                lh, lw = lvl_tpl.shape[:2]
+                if lh > lvl_img.shape[0] or lw > lvl_img.shape[1]:
+                    score = -1.0
+                    break
+                x0 = min(max(0, x - 8), lvl_img.shape[1] - lw)
+                y0 = min(max(0, y - 8), lvl_img.shape[0] - lh)
+                roi = lvl_img[
+                    y0 : min(lvl_img.shape[0], y + lh + 8),
+                    x0 : min(lvl_img.shape[1], x + lw + 8),
+                ]
+                # SQDIFF_NORMED skips the per-window mean subtraction CCOEFF
+                # pays for; 1 - value maps it back onto the similarity scale
+                # the thresholds use. The coarse pass above stays on CCOEFF
+                # to keep sharing the frame DFT.
+                result_roi = cv2.matchTemplate(roi, lvl_tpl, method)
+                if method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
+                    min_val, _, min_loc, _ = cv2.minMaxLoc(result_roi)
+                    score = 1.0 - min_val
+                    peak = min_loc
+                else:
+                    _, score, _, peak = cv2.minMaxLoc(result_roi)
+                x, y = x0 + peak[0], y0 + peak[1]
+
+            if score < thresh:
+                continue
 
-    Returns:
-        True on success, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "garden_return.png")
-    return locate_and_click(template_path, process_name, threshold)
+            is_new = True
+            for ex_x, ex_y, ex_w, ex_h in locations:
+                dx, dy = x - ex_x, y - ex_y
+                if dx * dx + dy * dy < R30_SQ:
+                    is_new = False
+                    break
+            if is_new:
+                locations.append((x, y, w, h))
+                hit_templates.append(levels[0])
+
+    hits = tuple(locations)
+    if hits:
+        _LAST_HITS[template_path] = (hits, hit_templates)
+    else:
+        _LAST_HITS.pop(template_path, None)
+    state["results"][memo_key] = hits
+    return hits
 
 
-def icon_huode(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Locate and click the 'huode' (obtained/reward) icon to close the reward screen.
+# ============================================================================
+# Template table
+# ============================================================================
+#
+# name -> (action, relative template paths, roi)
+#
+# action is "click" (locate and click) or "check" (detect without clicking).
+# Entries with more than one path are variant sets probed against a single
+# capture. Paths are resolved relative to ASSETS_DIR once, at import time.
+TEMPLATES = {
+    # Buttons
+    "button_luxiaohuiting": (
+        "click",
+        ("button/luxiaohuiting.png", "button/luxiaohuiting_gantanhao.png"),
+        None,
+    ),
+    "button_shouhuo": ("click", ("button/shouhuo.png",), None),
+    "button_zhongzhi": ("click", ("button/zhongzhi.png",), None),
+    "button_return": ("click", ("button/return.png",), None),
+    # Icons
+    "icon_shouhuo": ("click", ("icon/shouhuo.png",), None),
+    "icon_garden_zhongzhi": ("click", ("icon/garden_zhongzhi.png",), None),
+    "icon_garden_return": ("click", ("icon/garden_return.png",), ROI_GARDEN_RETURN),
+    "icon_huode": ("click", ("icon/huode.png",), None),
+    # Items
+    "item_is_in_select_music": ("check", ("item/is_in_select_music.png",), None),
+    # Plants
+    "plant_wuwangcao": ("click", ("plant/wuwangcao.png",), None),
+    "plant_shuangbaomogu": ("click", ("plant/shuangbaomogu.png",), None),
+    # Check functions (detection without clicking)
+    "check_luxiaohuiting": (
+        "check",
+        ("button/luxiaohuiting.png", "button/luxiaohuiting_gantanhao.png"),
+        None,
+    ),
+    "check_icon_shouhuo": ("check", ("icon/shouhuo.png",), None),
+    "check_is_in_garden": ("check", ("item/is_in_garden.png",), None),
+    "check_garden_zhongzhi": ("check", ("icon/garden_zhongzhi.png",), None),
+    "check_plant_wuwangcao": ("check", ("plant/wuwangcao.png",), None),
+    "check_plant_shuangbaomogu": ("check", ("plant/shuangbaomogu.png",), None),
+    "check_icon_huode": ("check", ("icon/huode.png",), None),
+}
+
+
+def _make_wrapper(name, action, rel_paths, roi):
+    """Build a locate/check wrapper for one TEMPLATES entry.
+
+    Paths are resolved here, once, so the generated function does no Path
+    arithmetic per call.
+    """
+    paths = [str(ASSETS_DIR / rel) for rel in rel_paths]
+    if len(paths) > 1:
+        core_fn = locate_and_click_multi if action == "click" else check_exists_multi
+        target = paths
+    else:
+        core_fn = locate_and_click if action == "click" else check_exists
+        target = paths[0]
+
+    def wrapper(
+        process_name: str = PROCESS_NAME,
+        threshold: float = MATCH_THRESHOLD,
+    ) -> bool:
+        return core_fn(target, process_name, threshold, roi=roi)
+
+    verb = "Locate and click" if action == "click" else "Check for"
+    wrapper.__name__ = name
+    wrapper.__qualname__ = name
+    wrapper.__doc__ = (
+        f"{verb} {' / '.join(rel_paths)}.\n\n"
+        "    Args:\n"
+        "        process_name: Name of the process to find (default: PROCESS_NAME)\n"
+        "        threshold: Match threshold (default: MATCH_THRESHOLD)\n\n"
+        "    Returns:\n"
+        "        True on success, False otherwise.\n    "
+    )
+    return wrapper
 
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
 
-    Returns:
-        True on success, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "huode.png")
-    return locate_and_click(template_path, process_name, threshold)
+# Generate the module-level wrappers so existing imports keep working
+# (``from functions import button_shouhuo`` etc.).
+for _name, (_action, _rel_paths, _roi) in TEMPLATES.items():
+    globals()[_name] = _make_wrapper(_name, _action, _rel_paths, _roi)
+del _name, _action, _rel_paths, _roi
 
 
 # ============================================================================
@@ -204,13 +517,11 @@ def item_konghuapen(
     """
     from core import (
         find_window_for_process,
-        bring_to_foreground,
-        capture_window,
+        capture_window_cached,
         click_screen,
+        _capture_seq,
+        _crop_roi,
     )
-    import cv2
-    import numpy as np
-    import time
 
     # Capture window once for all detections
     hwnd = find_window_for_process(process_name)
@@ -218,52 +529,18 @@ def item_konghuapen(
         print("[debug] item_konghuapen: Window not found")
         return False
 
-    bring_to_foreground(hwnd)
-    time.sleep(0.2)
-
-    screen, offset = capture_window(hwnd)
-
-    # Helper function to find all matches in the captured screen
-    def find_all_in_screen(template_path, thresh):
-        template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-        if template is None:
-            return []
-
-        from core import SCALES
-
-        locations = []
-
-        for scale in SCALES:
-            scaled = cv2.resize(
-                template,
-                dsize=None,
-                fx=scale,
-                fy=scale,
-                interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC,
-            )
-            h, w = scaled.shape[:2]
-            if h > screen.shape[0] or w > screen.shape[1]:
-                continue
-
-            result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
-            loc = np.where(result >= thresh)
+    _ensure_foreground(hwnd)
 
-            for pt in zip(*loc[::-1]):
-                x, y = pt
-                is_new = True
-                for ex_x, ex_y, ex_w, ex_h in locations:
-                    dist = ((x - ex_x) ** 2 + (y - ex_y) ** 2) ** 0.5
-                    if dist < 30:
-                        is_new = False
-                        break
-                if is_new:
-                    locations.append((x, y, w, h))
+    screen, offset = capture_window_cached(hwnd)
+    screen_id = _capture_seq(hwnd)
+    # Restrict the scan to the garden play area; detected coordinates are in
+    # ROI space and get translated back when converting to screen clicks.
+    screen, (roi_x, roi_y) = _crop_roi(screen, ROI_GARDEN)
 
-        return locations
 
     # Find all empty pot locations
     template_path = str(ASSETS_DIR / "item" / "konghuapen.png")
-    pot_locations = find_all_in_screen(template_path, threshold)
+    pot_locations = _find_all(screen, screen_id, template_path, threshold)
 
     if not pot_locations:
         print("[debug] item_konghuapen: No pots detected")
@@ -273,22 +550,22 @@ def item_konghuapen(
 
     # Find all seedling pot locations using the SAME screenshot
     seedling_locations = []
-    seedling_dir = ASSETS_DIR / "is_not_empty_huapen"
-    if seedling_dir.exists():
+    seedling_templates = _seedling_templates()
+    if seedling_templates:
         template_count = 0
-        for seedling_template in seedling_dir.glob("*.png"):
+        for seedling_template in seedling_templates:
             template_count += 1
             print(
-                f"[debug] item_konghuapen: Checking template: {seedling_template.name}"
+                f"[debug] item_konghuapen: Checking template: {os.path.basename(seedling_template)}"
             )
-            locs = find_all_in_screen(str(seedling_template), 0.75)
+            locs = _find_all(screen, screen_id, seedling_template, 0.75)
             if locs:
                 print(
-                    f"[debug] item_konghuapen: Found {len(locs)} seedling(s) with {seedling_template.name}"
+                    f"[debug] item_konghuapen: Found {len(locs)} seedling(s) with {os.path.basename(seedling_template)}"
                 )
             else:
                 print(
-                    f"[debug] item_konghuapen: No matches for {seedling_template.name}"
+                    f"[debug] item_konghuapen: No matches for {os.path.basename(seedling_template)}"
                 )
             seedling_locations.extend(locs)
         print(f"[debug] item_konghuapen: Checked {template_count} template(s)")
@@ -297,54 +574,38 @@ def item_konghuapen(
         f"[debug] item_konghuapen: Total seedlings to avoid: {len(seedling_locations)}"
     )
 
-    # Find first pot that is far from all seedlings and click it
-    for pot_x, pot_y, pot_w, pot_h in pot_locations:
-        pot_center_x = pot_x + pot_w // 2
-        pot_center_y = pot_y + pot_h // 2
-
-        is_empty = True
-        for s_x, s_y, s_w, s_h in seedling_locations:
-            s_center_x = s_x + s_w // 2
-            s_center_y = s_y + s_h // 2
-            distance = (
-                (pot_center_x - s_center_x) ** 2 + (pot_center_y - s_center_y) ** 2
-            ) ** 0.5
-
-            if distance < 80:
-                print(
-                    f"[info] Pot at ({pot_center_x}, {pot_center_y}) has seedling, skipping (distance: {distance:.1f}px)"
-                )
-                is_empty = False
-                break
-
-        if is_empty:
-            # Convert window coordinates to screen coordinates
-            screen_x = pot_center_x + offset[0]
-            screen_y = pot_center_y + offset[1]
-            print(
-                f"[info] Clicking empty pot at window({pot_center_x}, {pot_center_y}) -> screen({screen_x}, {screen_y})"
-            )
-            click_screen(screen_x, screen_y)
-            return True
-
-    return False
-
-
-def item_is_in_select_music(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if currently in music selection screen.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
+    # Find the first pot that is far from all seedlings and click it. The
+    # whole pot-vs-seedling proximity test is one einsum over the pairwise
+    # difference tensor — no Python-level iteration at all.
+    pot_centers = np.asarray(
+        [(x + w // 2, y + h // 2) for x, y, w, h in pot_locations], dtype=np.int32
+    )
+    if seedling_locations:
+        seed_centers = np.asarray(
+            [(x + w // 2, y + h // 2) for x, y, w, h in seedling_locations],
+            dtype=np.int32,
+        )
+        diff = pot_centers[:, None, :] - seed_centers[None, :, :]
+        dist_sq = np.einsum("ijk,ijk->ij", diff, diff)
+        is_empty = (dist_sq >= R80_SQ).all(axis=1)
+    else:
+        is_empty = np.ones(len(pot_locations), dtype=bool)
+
+    if not is_empty.any():
+        print(f"[info] All {len(pot_locations)} pot(s) have seedlings nearby")
+        return False
 
-    Returns:
-        True if found, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "item" / "is_in_select_music.png")
-    return check_exists(template_path, process_name, threshold)
+    idx = int(np.argmax(is_empty))
+    pot_center_x = int(pot_centers[idx, 0])
+    pot_center_y = int(pot_centers[idx, 1])
+    # Convert ROI coordinates to screen coordinates
+    screen_x = pot_center_x + roi_x + offset[0]
+    screen_y = pot_center_y + roi_y + offset[1]
+    print(
+        f"[info] Clicking empty pot at window({pot_center_x}, {pot_center_y}) -> screen({screen_x}, {screen_y})"
+    )
+    click_screen(screen_x, screen_y)
+    return True
 
 
 def plant_crop(
@@ -366,38 +627,6 @@ def plant_crop(
     return locate_and_click(template_path, process_name, threshold)
 
 
-def plant_wuwangcao(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Convenience function to plant wuwangcao (forget-me-not).
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True on success, False otherwise.
-    """
-    return plant_crop("wuwangcao", process_name, threshold)
-
-
-def plant_shuangbaomogu(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Convenience function to plant shuangbaomogu (double spore mushroom).
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True on success, False otherwise.
-    """
-    return plant_crop("shuangbaomogu", process_name, threshold)
-
-
 # Keep backward compatibility alias
 item_crop = plant_crop
 
@@ -407,30 +636,6 @@ item_crop = plant_crop
 # ============================================================================
 
 
-def check_luxiaohuiting(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if 'luxiaohuiting' button exists without clicking (supports two variants).
-
-    This function supports two variants of the button:
-    - luxiaohuiting.png (normal state)
-    - luxiaohuiting_gantanhao.png (with exclamation mark)
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True if found, False otherwise.
-    """
-    template_paths = [
-        str(ASSETS_DIR / "button" / "luxiaohuiting.png"),
-        str(ASSETS_DIR / "button" / "luxiaohuiting_gantanhao.png"),
-    ]
-    return check_exists_multi(template_paths, process_name, threshold)
-
-
 def check_konghuapen(
     process_name: str = PROCESS_NAME,
     threshold: float = MATCH_THRESHOLD,
@@ -447,10 +652,12 @@ def check_konghuapen(
     Returns:
         True if empty pot found (without seedling nearby), False otherwise.
     """
-    from core import find_window_for_process, bring_to_foreground, capture_window
-    import cv2
-    import numpy as np
-    import time
+    from core import (
+        find_window_for_process,
+        capture_window_cached,
+        _capture_seq,
+        _crop_roi,
+    )
 
     # Capture window once for all detections
     hwnd = find_window_for_process(process_name)
@@ -458,53 +665,17 @@ def check_konghuapen(
         print("[debug] Window not found")
         return False
 
-    bring_to_foreground(hwnd)
-    time.sleep(0.2)  # Longer wait to ensure window is ready
-
-    screen, offset = capture_window(hwnd)
-
-    # Helper function to find all matches in the captured screen
-    def find_all_in_screen(template_path, thresh):
-        template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-        if template is None:
-            return []
+    _ensure_foreground(hwnd)
 
-        from core import SCALES
+    screen, offset = capture_window_cached(hwnd)
+    screen_id = _capture_seq(hwnd)
+    # Restrict the scan to the garden play area.
+    screen, (roi_x, roi_y) = _crop_roi(screen, ROI_GARDEN)
 
-        locations = []
-
-        for scale in SCALES:
-            scaled = cv2.resize(
-                template,
-                dsize=None,
-                fx=scale,
-                fy=scale,
-                interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC,
-            )
-            h, w = scaled.shape[:2]
-            if h > screen.shape[0] or w > screen.shape[1]:
-                continue
-
-            result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
-            loc = np.where(result >= thresh)
-
-            for pt in zip(*loc[::-1]):
-                x, y = pt
-                # Avoid duplicates
-                is_new = True
-                for ex_x, ex_y, ex_w, ex_h in locations:
-                    dist = ((x - ex_x) ** 2 + (y - ex_y) ** 2) ** 0.5
-                    if dist < 30:
-                        is_new = False
-                        break
-                if is_new:
-                    locations.append((x, y, w, h))
-
-        return locations
 
     # Find all empty pot locations
     template_path = str(ASSETS_DIR / "item" / "konghuapen.png")
-    pot_locations = find_all_in_screen(template_path, threshold)
+    pot_locations = _find_all(screen, screen_id, template_path, threshold)
 
     if not pot_locations:
         print("[debug] No pots detected")
@@ -514,151 +685,53 @@ def check_konghuapen(
 
     # Find all seedling pot locations using the SAME screenshot
     seedling_locations = []
-    seedling_dir = ASSETS_DIR / "is_not_empty_huapen"
-    if seedling_dir.exists():
+    seedling_templates = _seedling_templates()
+    if seedling_templates:
         template_count = 0
-        for seedling_template in seedling_dir.glob("*.png"):
+        for seedling_template in seedling_templates:
             template_count += 1
-            print(f"[debug] Checking seedling template: {seedling_template.name}")
-            locs = find_all_in_screen(str(seedling_template), 0.75)
+            print(
+                f"[debug] Checking seedling template: {os.path.basename(seedling_template)}"
+            )
+            locs = _find_all(screen, screen_id, seedling_template, 0.75)
             if locs:
                 print(
-                    f"[debug] Found {len(locs)} seedling(s) with template {seedling_template.name}"
+                    f"[debug] Found {len(locs)} seedling(s) with template {os.path.basename(seedling_template)}"
                 )
             else:
-                print(f"[debug] No matches for template {seedling_template.name}")
+                print(
+                    f"[debug] No matches for template {os.path.basename(seedling_template)}"
+                )
             seedling_locations.extend(locs)
         print(f"[debug] Checked {template_count} seedling template(s)")
 
     print(f"[debug] Total seedlings detected: {len(seedling_locations)}")
 
-    # Check if any pot is far from all seedlings
-    for pot_x, pot_y, pot_w, pot_h in pot_locations:
-        pot_center_x = pot_x + pot_w // 2
-        pot_center_y = pot_y + pot_h // 2
-
-        is_empty = True
-        for s_x, s_y, s_w, s_h in seedling_locations:
-            s_center_x = s_x + s_w // 2
-            s_center_y = s_y + s_h // 2
-            distance = (
-                (pot_center_x - s_center_x) ** 2 + (pot_center_y - s_center_y) ** 2
-            ) ** 0.5
-
-            if distance < 80:
-                print(
-                    f"[info] Pot at ({pot_center_x}, {pot_center_y}) has seedling nearby (distance: {distance:.1f}px)"
-                )
-                is_empty = False
-                break
-
-        if is_empty:
-            print(f"[info] Found empty pot at ({pot_center_x}, {pot_center_y})")
-            return True
-
-    return False
-
-
-def check_icon_shouhuo(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if 'shouhuo' icon exists without clicking.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True if found, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "shouhuo.png")
-    return check_exists(template_path, process_name, threshold)
-
-
-def check_is_in_garden(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if currently in garden interface.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True if in garden, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "item" / "is_in_garden.png")
-    return check_exists(template_path, process_name, threshold)
-
-
-def check_garden_zhongzhi(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if currently in plant selection interface.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True if in plant selection, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "garden_zhongzhi.png")
-    return check_exists(template_path, process_name, threshold)
-
-
-def check_plant_wuwangcao(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if wuwangcao (forget-me-not) plant is visible/planted.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True if wuwangcao is visible, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "plant" / "wuwangcao.png")
-    return check_exists(template_path, process_name, threshold)
-
-
-def check_plant_shuangbaomogu(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if shuangbaomogu (double spore mushroom) plant is visible/planted.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
-
-    Returns:
-        True if shuangbaomogu is visible, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "plant" / "shuangbaomogu.png")
-    return check_exists(template_path, process_name, threshold)
-
-
-def check_icon_huode(
-    process_name: str = PROCESS_NAME,
-    threshold: float = MATCH_THRESHOLD,
-) -> bool:
-    """Check if 'huode' (obtained/reward) screen is visible.
-
-    Args:
-        process_name: Name of the process to find (default: PROCESS_NAME)
-        threshold: Match threshold (default: MATCH_THRESHOLD)
+    # Check if any pot is far from all seedlings: one einsum over the
+    # pairwise difference tensor — no Python-level iteration at all.
+    pot_centers = np.asarray(
+        [(x + w // 2, y + h // 2) for x, y, w, h in pot_locations], dtype=np.int32
+    )
+    if seedling_locations:
+        seed_centers = np.asarray(
+            [(x + w // 2, y + h // 2) for x, y, w, h in seedling_locations],
+            dtype=np.int32,
+        )
+        diff = pot_centers[:, None, :] - seed_centers[None, :, :]
+        dist_sq = np.einsum("ijk,ijk->ij", diff, diff)
+        is_empty = (dist_sq >= R80_SQ).all(axis=1)
+    else:
+        is_empty = np.ones(len(pot_locations), dtype=bool)
+
+    if not is_empty.any():
+        print(f"[info] All {len(pot_locations)} pot(s) have seedlings nearby")
+        return False
 
-    Returns:
-        True if reward screen is visible, False otherwise.
-    """
-    template_path = str(ASSETS_DIR / "icon" / "huode.png")
-    return check_exists(template_path, process_name, threshold)
+    idx = int(np.argmax(is_empty))
+    pot_center_x = int(pot_centers[idx, 0])
+    pot_center_y = int(pot_centers[idx, 1])
+    print(f"[info] Found empty pot at ({pot_center_x}, {pot_center_y})")
+    return True
 
 
 # ============================================================================
@@ -666,34 +739,23 @@ def check_icon_huode(
 # ============================================================================
 
 
-def get_all_functions():
-    """Return a dictionary of all available click functions."""
-    return {
-        # Buttons
-        "button_luxiaohuiting": button_luxiaohuiting,
-        "button_shouhuo": button_shouhuo,
-        "button_zhongzhi": button_zhongzhi,
-        "button_return": button_return,
-        # Icons
-        "icon_shouhuo": icon_shouhuo,
-        "icon_garden_zhongzhi": icon_garden_zhongzhi,
-        "icon_garden_return": icon_garden_return,
-        "icon_huode": icon_huode,
+# Frozen once at import time: register_functions asks for this mapping on
+# every engine construction, and nothing mutates it afterwards. The proxy
+# keeps callers from accidentally shadowing a function for everyone.
+_ALL_FUNCTIONS = types.MappingProxyType(
+    {
+        **{name: globals()[name] for name in TEMPLATES},
         # Items
         "item_konghuapen": item_konghuapen,
-        "item_is_in_select_music": item_is_in_select_music,
         # Plants
         "plant_crop": plant_crop,
-        "plant_wuwangcao": plant_wuwangcao,
-        "plant_shuangbaomogu": plant_shuangbaomogu,
         "item_crop": item_crop,  # Backward compatibility
         # Check functions
-        "check_luxiaohuiting": check_luxiaohuiting,
         "check_konghuapen": check_konghuapen,
-        "check_icon_shouhuo": check_icon_shouhuo,
-        "check_is_in_garden": check_is_in_garden,
-        "check_garden_zhongzhi": check_garden_zhongzhi,
-        "check_plant_wuwangcao": check_plant_wuwangcao,
-        "check_plant_shuangbaomogu": check_plant_shuangbaomogu,
-        "check_icon_huode": check_icon_huode,
     }
+)
+
+
+def get_all_functions():
+    """Return a read-only mapping of all available click functions."""
+    return _ALL_FUNCTIONS
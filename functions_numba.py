@@ -0,0 +1,67 @@
+"""Optional Numba kernels for the pot-detection helpers.
+
+The full-frame coarse scans in functions.py use small templates once the
+pyramid has shrunk them, and for those cv2.matchTemplate's generic dispatch
+and FFT-crossover heuristics cost more than the arithmetic. This module
+provides a row-parallel ZNCC scanner for that case.
+
+Importing it is always safe: when numba is not installed, ``zncc_small`` is
+None and callers fall back to cv2.matchTemplate.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba  # ty:ignore[unresolved-import]
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def zncc_small(src: np.ndarray, tpl: np.ndarray) -> np.ndarray:
+        """ZNCC (TM_CCOEFF_NORMED) over all placements, output rows in parallel.
+
+        Template statistics are computed once up front; each prange row then
+        only accumulates window sums and the cross term, which LLVM
+        vectorizes. Allocates nothing but the output map.
+        """
+        th, tw = tpl.shape
+        n = th * tw
+        tpl_sum = 0.0
+        tpl_sq = 0.0
+        for i in range(th):
+            for j in range(tw):
+                v = np.float64(tpl[i, j])
+                tpl_sum += v
+                tpl_sq += v * v
+        tpl_mean = tpl_sum / n
+        tpl_var = tpl_sq - tpl_sum * tpl_mean
+
+        out_h = src.shape[0] - th + 1
+        out_w = src.shape[1] - tw + 1
+        out = np.empty((out_h, out_w), np.float32)
+        for y in numba.prange(out_h):
+            for x in range(out_w):
+                win_sum = 0.0
+                win_sq = 0.0
+                cross = 0.0
+                for i in range(th):
+                    for j in range(tw):
+                        v = np.float64(src[y + i, x + j])
+                        win_sum += v
+                        win_sq += v * v
+                        cross += v * tpl[i, j]
+                numerator = cross - win_sum * tpl_mean
+                denominator = (win_sq - win_sum * win_sum / n) * tpl_var
+                if denominator > 1e-12:
+                    out[y, x] = np.float32(numerator / np.sqrt(denominator))
+                else:
+                    out[y, x] = 0.0
+        return out
+
+else:
+    zncc_small = None
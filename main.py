@@ -18,6 +18,7 @@ Usage:
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -91,6 +92,18 @@ def list_functions():
     print("\n" + "=" * 70)
 
 
+@lru_cache(maxsize=1)
+def _engine_singleton() -> WorkflowEngine:
+    """One engine, constructed and wired on first use.
+
+    Engine construction loads the YAML workflows from disk; commands that run
+    back-to-back (auto = navigate + plant + monitor) should not repeat that.
+    """
+    engine = WorkflowEngine()
+    engine.register_functions(get_all_functions())
+    return engine
+
+
 def run_auto_workflow(crop_name: Optional[str] = None) -> int:
     """Run the complete auto garden workflow.
 
@@ -111,9 +124,7 @@ def run_plant_workflow(crop_name: str) -> int:
     """Run planting workflow for a specific crop using YAML workflow."""
     print(f"\n🌱 Planting crop: {crop_name}")
 
-    # Initialize engine and register functions
-    engine = WorkflowEngine()
-    engine.register_functions(get_all_functions())
+    engine = _engine_singleton()
 
     try:
         # Execute navigate + plant workflow
@@ -130,9 +141,7 @@ def run_harvest_workflow() -> int:
     """Run harvest workflow once using YAML workflow."""
     print("\n🌾 Running harvest workflow...")
 
-    # Initialize engine and register functions
-    engine = WorkflowEngine()
-    engine.register_functions(get_all_functions())
+    engine = _engine_singleton()
 
     try:
         engine.execute_workflow("harvest")
@@ -148,9 +157,7 @@ def run_monitor_loop(interval: float = 10.0) -> int:
     print(f"\n👁 Starting harvest monitor (interval: {interval}s)")
     print("Press Ctrl+C to stop\n")
 
-    # Initialize engine and register functions
-    engine = WorkflowEngine()
-    engine.register_functions(get_all_functions())
+    engine = _engine_singleton()
 
     try:
         # Note: monitor_harvest workflow has event_loop built-in
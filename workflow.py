@@ -9,11 +9,105 @@ This module provides a YAML-based workflow orchestration system that supports:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import pickle
+import sys
 import time
+from collections import ChainMap, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional, Any, Dict, List
 from dataclasses import dataclass
-import yaml
+from functools import lru_cache, partial
+
+# PyYAML is only needed on a disk-cache miss; defer the import so engine
+# construction (and runs served entirely from the pickle cache) never pays
+# for loading it.
+_yaml_loader = None
+
+
+def _get_yaml_loader():
+    global _yaml_loader
+    if _yaml_loader is None:
+        import yaml
+
+        try:
+            # libyaml's C parser, several times faster than the pure-Python
+            # tokenizer.
+            from yaml import CSafeLoader as loader_cls
+        except ImportError:
+            from yaml import SafeLoader as loader_cls
+        _yaml_loader = (yaml, loader_cls)
+    return _yaml_loader
+
+
+_log = logging.getLogger("workflow")
+# Keep the CLI chatty by default; callers that configure logging themselves
+# (or raise the level to WARNING) silence the per-step messages, and the
+# format strings are then never built at all.
+if not logging.getLogger().hasHandlers():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+def _load_parsed(data: bytes, cache_dir: Path) -> Dict:
+    """Parse workflow YAML bytes, via an on-disk pickle cache.
+
+    Keyed by content hash, so a cold process start unpickles the parsed
+    document instead of re-running the YAML parser; an edited file simply
+    hashes to a new entry. Only the parsed document is persisted — the
+    compiled IR holds registry callables and is rebuilt per engine. The
+    cache directory is best-effort: a read-only tree just parses.
+    """
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{digest}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError):
+        pass
+
+    yaml, loader_cls = _get_yaml_loader()
+    workflow_data = yaml.load(data, Loader=loader_cls)
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(workflow_data, f, protocol=5)
+    except OSError:
+        pass
+    return workflow_data
+
+
+# Parsed documents shared by every engine instance, so scripts and test
+# loops that recreate engines over the same tree never re-parse a file.
+# mtime and size in the key give invalidation for free: an edited file is
+# simply a new entry, and stale ones age out of the LRU.
+@lru_cache(maxsize=4096)
+def _load_raw(path_str: str, mtime_ns: int, size: int, cache_dir_str: str) -> Dict:
+    # Binary mode: the loader decodes utf-8 itself, skipping the
+    # Python-side text layer.
+    with open(path_str, "rb") as f:
+        data = f.read()
+    return _load_parsed(data, Path(cache_dir_str))
+
+# Compiled workflow IR: one typed record per step, built once per workflow so
+# the hot path does straight attribute access instead of re-reading half a
+# dozen dict keys per step per iteration. ``func`` holds the registry entry
+# resolved at compile time; the name is kept for functions registered later.
+_ActionStep = namedtuple(
+    "_ActionStep", "name call description wait_after retry optional param_name"
+)
+_SubWorkflowStep = namedtuple("_SubWorkflowStep", "workflow description params")
+_ConditionStep = namedtuple(
+    "_ConditionStep", "name func description on_true on_false run_true run_false"
+)
+_EventLoopStep = namedtuple("_EventLoopStep", "name interval handlers")
+_EventHandler = namedtuple("_EventHandler", "name condition func actions run")
+# What loaded_workflows holds: the compiled step tuple (None when the document
+# had no "steps" key) plus the resolved source path. The raw YAML dict is
+# discarded after compilation — its str/list/dict nodes roughly double the
+# per-workflow footprint; use get_raw() when the document itself is needed.
+_CompiledWorkflow = namedtuple("_CompiledWorkflow", "steps run file")
 
 
 class WorkflowEngine:
@@ -21,233 +115,489 @@ class WorkflowEngine:
 
     def __init__(self, workflows_dir: str = "workflows"):
         self.workflows_dir = Path(workflows_dir)
-        self.loaded_workflows: Dict[str, Dict] = {}
+        self._parse_cache_dir = self.workflows_dir / ".cache"
+        self.loaded_workflows: Dict[str, _CompiledWorkflow] = {}
         self.function_registry: Dict[str, Callable] = {}
-        self.workflow_stack: List[Path] = (
-            []
-        )  # Track current workflow path for relative imports
-
-    def register_function(self, name: str, func: Callable) -> None:
-        """Register a function that can be called from workflows."""
+        # Directory of the workflow currently executing, for relative
+        # imports; saved/restored around each nested execute_workflow call.
+        self._current_parent: Optional[Path] = None
+        # (workflow_name, current dir) -> _CompiledWorkflow: skips Path
+        # arithmetic, resolve() and stat entirely on warm re-entry.
+        self._name_cache: Dict[tuple, _CompiledWorkflow] = {}
+        self._stat_cache: Dict[str, Any] = {}
+        self._jit_originals: Dict[str, Callable] = {}
+        self._dispatch = {
+            _ActionStep: self._run_action,
+            _SubWorkflowStep: self._run_sub_workflow,
+            _ConditionStep: self._run_condition,
+            _EventLoopStep: self._run_event_loop,
+        }
+        self._step_compilers = {
+            "action": self._compile_action,
+            "workflow": self._compile_sub_workflow,
+            "condition": self._compile_condition,
+            "event_loop": self._compile_event_loop,
+        }
+
+    def register_function(
+        self,
+        name: str,
+        func: Callable,
+        jit: bool = False,
+        warmup_args: Optional[tuple] = None,
+    ) -> None:
+        """Register a function that can be called from workflows.
+
+        With ``jit=True`` the callable is compiled with numba.njit(cache=True)
+        before registration — only worthwhile for pure-numeric functions; the
+        OpenCV-based click helpers cannot be nopython-compiled. Passing
+        ``warmup_args`` forces compilation here, at register time, so the
+        first event-loop tick does not pay it (and lets a function that numba
+        cannot type fall back to the interpreted original instead of failing
+        later). Numba's on-disk cache makes later process starts skip the
+        compile entirely. When numba is not installed, ``jit`` is ignored.
+        """
+        if jit:
+            try:
+                import numba  # ty:ignore[unresolved-import]
+            except ImportError:
+                numba = None
+            if numba is not None:
+                try:
+                    compiled = numba.njit(cache=True)(func)
+                    if warmup_args is not None:
+                        compiled(*warmup_args)
+                except Exception as e:
+                    _log.warning("[Warn] JIT of '%s' failed, keeping original: %s", name, e)
+                else:
+                    self._jit_originals[name] = func
+                    func = compiled
         self.function_registry[name] = func
 
     def register_functions(self, functions: Dict[str, Callable]) -> None:
         """Register multiple functions at once."""
         self.function_registry.update(functions)
 
+    def _resolve_workflow_path(
+        self, workflow_name: str, current_workflow_dir: Optional[Path]
+    ) -> Path:
+        """Map a workflow name or relative path to its resolved .yml path."""
+        if workflow_name.startswith("./") or workflow_name.startswith("../"):
+            if current_workflow_dir is None:
+                current_workflow_dir = self.workflows_dir
+            workflow_file = (current_workflow_dir / workflow_name).with_suffix(".yml")
+        else:
+            # Absolute path from workflows root
+            workflow_file = self.workflows_dir / f"{workflow_name}.yml"
+        return workflow_file.resolve()
+
     def load_workflow(
         self, workflow_name: str, current_workflow_dir: Optional[Path] = None
-    ) -> tuple[Dict, Path]:
-        """Load a workflow from YAML file.
+    ) -> _CompiledWorkflow:
+        """Load and compile a workflow from YAML file.
 
         Args:
             workflow_name: Workflow name or relative path (e.g., "./common/navigate" or "auto_garden")
             current_workflow_dir: Directory of the current workflow (for relative imports)
 
         Returns:
-            Tuple of (workflow_data, workflow_file_path)
+            The compiled workflow record; the raw document is not retained.
         """
-        # Check if it's a relative path
-        if workflow_name.startswith("./") or workflow_name.startswith("../"):
-            if current_workflow_dir is None:
-                current_workflow_dir = self.workflows_dir
-            workflow_file = (current_workflow_dir / workflow_name).with_suffix(".yml")
-        else:
-            # Absolute path from workflows root
-            workflow_file = self.workflows_dir / f"{workflow_name}.yml"
+        name_key = (workflow_name, current_workflow_dir)
+        hit = self._name_cache.get(name_key)
+        if hit is not None:
+            return hit
 
-        # Normalize the path
-        workflow_file = workflow_file.resolve()
+        workflow_file = self._resolve_workflow_path(workflow_name, current_workflow_dir)
 
         # Use normalized path as cache key
         cache_key = str(workflow_file)
-        if cache_key in self.loaded_workflows:
-            return self.loaded_workflows[cache_key], workflow_file
+        compiled = self.loaded_workflows.get(cache_key)
+        if compiled is not None:
+            self._name_cache[name_key] = compiled
+            return compiled
+
+        st = self._stat_cache.get(cache_key)
+        if st is None:
+            try:
+                st = workflow_file.stat()
+            except OSError:
+                raise FileNotFoundError(f"Workflow file not found: {workflow_file}")
+            self._stat_cache[cache_key] = st
+
+        # Shared across engine instances; one stat call validates the entry.
+        workflow_data = _load_raw(
+            cache_key, st.st_mtime_ns, st.st_size, str(self._parse_cache_dir)
+        )
+
+        # Compile straight away and keep only the IR; workflow_data goes out
+        # of scope here (modulo the shared _load_raw entry, which exists to
+        # serve other engine instances and get_raw()).
+        steps_data = workflow_data.get("steps")
+        steps = self._compile_steps(steps_data) if steps_data is not None else None
+        compiled = _CompiledWorkflow(
+            steps,
+            self._compile_runner(steps) if steps is not None else None,
+            workflow_file,
+        )
+        self.loaded_workflows[cache_key] = compiled
+        self._name_cache[name_key] = compiled
+        self._preload_sub_workflows(compiled.steps, workflow_file.parent)
+        return compiled
+
+    def get_raw(
+        self, workflow_name: str, current_workflow_dir: Optional[Path] = None
+    ) -> Dict:
+        """Return the parsed YAML document, re-reading on demand.
 
-        if not workflow_file.exists():
+        The engine only retains compiled IR; callers that need the raw
+        document (introspection, tooling) pay for a fresh read here, served
+        from the parse caches when warm.
+        """
+        workflow_file = self._resolve_workflow_path(workflow_name, current_workflow_dir)
+        try:
+            with open(workflow_file, "rb") as f:
+                data = f.read()
+        except OSError:
             raise FileNotFoundError(f"Workflow file not found: {workflow_file}")
+        return _load_parsed(data, self._parse_cache_dir)
 
-        with open(workflow_file, "r", encoding="utf-8") as f:
-            workflow_data = yaml.safe_load(f)
+    def _preload_sub_workflows(self, steps: Optional[tuple], parent_dir: Path) -> None:
+        """Pre-parse every sub-workflow a freshly compiled workflow references.
 
-        self.loaded_workflows[cache_key] = workflow_data
-        return workflow_data, workflow_file
+        The references are loaded concurrently, so a chain of serialized
+        open+stat+parse calls becomes a single wavefront; the open/stat
+        syscalls overlap, which dominates for small YAML. All caches are
+        plain dicts mutated under the GIL — a race costs at most a
+        duplicate parse of the same file. Broken references are ignored
+        here and surface when the step actually runs.
+        """
+        names: list[str] = []
+
+        def scan(steps):
+            for step in steps or ():
+                if isinstance(step, _SubWorkflowStep):
+                    if (step.workflow, parent_dir) not in self._name_cache:
+                        names.append(step.workflow)
+                elif isinstance(step, _ConditionStep):
+                    scan(step.on_true)
+                    scan(step.on_false)
+                elif isinstance(step, _EventLoopStep):
+                    for handler in step.handlers:
+                        scan(handler.actions)
+
+        scan(steps)
+        if not names:
+            return
+
+        def load_one(name: str) -> None:
+            try:
+                self.load_workflow(name, parent_dir)
+            except (FileNotFoundError, ValueError):
+                pass
+
+        if len(names) == 1:
+            load_one(names[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+            pool.map(load_one, names)
+
+    def prime_cache(self) -> None:
+        """Batch-stat the whole workflow tree in one pass.
+
+        Loading a workflow that references N sub-workflows otherwise pays an
+        independent stat chain per file; after priming, every load_workflow
+        hits the in-memory stat map. Primed entries are trusted for the
+        engine's lifetime — call again to pick up on-disk edits.
+        """
+        self._stat_cache = {
+            str(path.resolve()): path.stat()
+            for path in self.workflows_dir.rglob("*.yml")
+        }
 
     def execute_workflow(
         self, workflow_name: str, params: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Execute a workflow by name with optional parameters."""
-        print(f"\n{'='*60}")
-        print(f"Executing workflow: {workflow_name}")
-        if params:
-            print(f"Parameters: {params}")
-        print(f"{'='*60}")
-
-        # Get current workflow directory from stack (for relative imports)
-        current_dir = self.workflow_stack[-1].parent if self.workflow_stack else None
-        workflow, workflow_file = self.load_workflow(workflow_name, current_dir)
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("\n%s", "=" * 60)
+            _log.info("Executing workflow: %s", workflow_name)
+            if params:
+                _log.info("Parameters: %s", params)
+            _log.info("%s", "=" * 60)
+
+        # Current workflow directory (for relative imports)
+        try:
+            compiled = self.load_workflow(workflow_name, self._current_parent)
+        except ValueError as e:
+            _log.error("[Error] %s", e)
+            return False
         params = params or {}
 
-        if "steps" not in workflow:
-            print(f"[Error] No steps found in workflow '{workflow_name}'")
+        if compiled.steps is None:
+            _log.error("[Error] No steps found in workflow '%s'", workflow_name)
             return False
 
-        # Push current workflow to stack
-        self.workflow_stack.append(workflow_file)
+        prev_parent = self._current_parent
+        self._current_parent = compiled.file.parent
         try:
-            return self._execute_steps(workflow["steps"], params)
+            return compiled.run(params)
         finally:
-            # Pop from stack when done
-            self.workflow_stack.pop()
+            self._current_parent = prev_parent
 
-    def _execute_steps(self, steps: list, params: Dict[str, Any]) -> bool:
-        """Execute a list of workflow steps."""
-        for step_data in steps:
-            if not self._execute_step(step_data, params):
-                return False
-        return True
+    def _compile_steps(self, steps: list) -> tuple:
+        """Compile raw step dicts into the typed IR, recursively."""
+        return tuple(self._compile_step(step) for step in steps)
 
-    def _execute_step(self, step_data: Dict, params: Dict[str, Any]) -> bool:
-        """Execute a single workflow step."""
+    def _compile_step(self, step_data: Dict):
+        """Compile one step dict into its IR record.
+
+        Registry lookups happen here, once; steps whose function is not yet
+        registered compile with ``func=None`` and fall back to a lookup at
+        run time, so registration order does not matter.
+        """
         step_type = step_data.get("type", "action")
+        compiler = self._step_compilers.get(step_type)
+        if compiler is None:
+            raise ValueError(f"Unknown step type: {step_type}")
+        return compiler(step_data)
 
-        if step_type == "action":
-            return self._execute_action(step_data, params)
-        elif step_type == "workflow":
-            return self._execute_sub_workflow(step_data, params)
-        elif step_type == "condition":
-            return self._execute_condition(step_data, params)
-        elif step_type == "event_loop":
-            return self._execute_event_loop(step_data, params)
-        else:
-            print(f"[Error] Unknown step type: {step_type}")
-            return False
+    @staticmethod
+    def _intern(name):
+        """Intern YAML-sourced registry/param keys.
+
+        Each parse yields fresh str objects; interning lets the later dict
+        lookups hit CPython's pointer-equality fast path.
+        """
+        return sys.intern(name) if isinstance(name, str) else name
+
+    @staticmethod
+    def _bind_call(func, param_name):
+        """Bake the argument decision into the compiled call.
 
-    def _execute_action(self, action_data: Dict, params: Dict[str, Any]) -> bool:
-        """Execute a single action."""
-        action_name = action_data.get("action")
-        description = action_data.get("description", action_name)
-        wait_after = action_data.get("wait_after", 0.5)
-        retry = action_data.get("retry", 1)
-        optional = action_data.get("optional", False)
+        Parameterless actions get a closure that just calls ``func()`` —
+        no argument list is built and nothing is splatted per invocation.
+        """
+        if func is None:
+            return None
+        if param_name is None:
+            return lambda params: func()
+
+        def call(params, _name=param_name, _func=func):
+            return _func(params[_name]) if _name in params else _func()
+
+        return call
+
+    def _compile_action(self, step_data: Dict) -> _ActionStep:
+        action_name = self._intern(step_data.get("action"))
+        param_name = self._intern(step_data.get("param"))
+        return _ActionStep(
+            action_name,
+            self._bind_call(self.function_registry.get(action_name), param_name),
+            step_data.get("description", action_name),
+            step_data.get("wait_after", 0.5),
+            step_data.get("retry", 1),
+            step_data.get("optional", False),
+            param_name,
+        )
 
-        if action_name not in self.function_registry:
-            print(f"[Error] Function '{action_name}' not registered")
-            return not optional
+    def _compile_sub_workflow(self, step_data: Dict) -> _SubWorkflowStep:
+        workflow_name = step_data.get("workflow")
+        if not workflow_name or not isinstance(workflow_name, str):
+            raise ValueError("No workflow name specified in sub-workflow")
+        return _SubWorkflowStep(
+            sys.intern(workflow_name),
+            step_data.get("description", f"Sub-workflow: {workflow_name}"),
+            step_data.get("params", {}),
+        )
 
-        func = self.function_registry[action_name]
+    def _compile_condition(self, step_data: Dict) -> _ConditionStep:
+        condition_name = self._intern(step_data.get("condition"))
+        on_true = self._compile_steps(step_data.get("on_true", []))
+        on_false = self._compile_steps(step_data.get("on_false", []))
+        return _ConditionStep(
+            condition_name,
+            self.function_registry.get(condition_name),
+            step_data.get("description", condition_name),
+            on_true,
+            on_false,
+            self._compile_runner(on_true),
+            self._compile_runner(on_false),
+        )
 
-        # Handle dynamic parameters
-        func_params = []
-        if "param" in action_data:
-            param_name = action_data["param"]
-            if param_name in params:
-                func_params.append(params[param_name])
+    def _compile_event_loop(self, step_data: Dict) -> _EventLoopStep:
+        return _EventLoopStep(
+            step_data.get("name", "Event Loop"),
+            step_data.get("interval", 10.0),
+            tuple(
+                self._compile_event_handler(handler)
+                for handler in step_data.get("handlers", [])
+            ),
+        )
 
-        print(f"\n[Action] {description}")
+    def _compile_event_handler(self, handler: Dict) -> _EventHandler:
+        actions = self._compile_steps(handler.get("actions", []))
+        return _EventHandler(
+            handler.get("name", "Handler"),
+            self._intern(handler.get("condition")),
+            self.function_registry.get(handler.get("condition")),
+            actions,
+            self._compile_runner(actions),
+        )
 
-        for attempt in range(retry):
+    def _compile_runner(self, steps: tuple) -> Callable[[Dict[str, Any]], bool]:
+        """Generate a straight-line run function for a compiled sequence.
+
+        The step list is fixed once compiled, so instead of a generic
+        loop-and-dispatch the sequence is lowered to one unrolled function
+        — each line calls a dispatcher already bound to its step, with no
+        per-step type lookup or iteration machinery left at run time.
+        """
+        if not steps:
+            return lambda params: True
+        dispatch = self._dispatch
+        namespace = {
+            f"_step{i}": partial(dispatch[type(step)], step)
+            for i, step in enumerate(steps)
+        }
+        body = "".join(
+            f"    if not _step{i}(params):\n        return False\n"
+            for i in range(len(steps))
+        )
+        exec(
+            compile(f"def run(params):\n{body}    return True\n", "<runner>", "exec"),
+            namespace,
+        )
+        return namespace["run"]
+
+    def _run_action(self, step: _ActionStep, params: Dict[str, Any]) -> bool:
+        """Execute a compiled action step."""
+        call = step.call
+        if call is None:
+            # Registered after compilation — rebind on the fly.
+            call = self._bind_call(
+                self.function_registry.get(step.name), step.param_name
+            )
+            if call is None:
+                _log.error("[Error] Function '%s' not registered", step.name)
+                return not step.optional
+
+        _log.info("\n[Action] %s", step.description)
+
+        retry_delay = 1.0
+        for attempt in range(step.retry):
+            # One success exit, one retry tail: the failure and exception
+            # paths share the same sleep/log site, and the last attempt
+            # never sleeps.
+            result = False
             try:
-                result = func(*func_params) if func_params else func()
-                if result:
-                    print(f"[Action] ✓ {description} succeeded")
-                    if wait_after > 0:
-                        time.sleep(wait_after)
-                    return True
-                else:
-                    if attempt < retry - 1:
-                        print(f"[Action] ⟳ Retrying ({attempt + 1}/{retry})...")
-                        time.sleep(1.0)
+                result = call(params)
             except Exception as e:
-                print(f"[Action] ✗ Error: {e}")
-                if attempt < retry - 1:
-                    time.sleep(1.0)
-
-        if optional:
-            print("[Action] ⊘ Failed but optional, continuing...")
+                _log.warning("[Action] ✗ Error: %s", e)
+            if result:
+                _log.info("[Action] ✓ %s succeeded", step.description)
+                if step.wait_after > 0:
+                    time.sleep(step.wait_after)
+                return True
+            if attempt + 1 < step.retry:
+                _log.info("[Action] ⟳ Retrying (%d/%d)...", attempt + 1, step.retry)
+                time.sleep(retry_delay)
+
+        if step.optional:
+            _log.info("[Action] ⊘ Failed but optional, continuing...")
             return True
 
-        print(f"[Action] ✗ {description} failed")
+        _log.warning("[Action] ✗ %s failed", step.description)
         return False
 
-    def _execute_sub_workflow(
-        self, workflow_data: Dict, params: Dict[str, Any]
-    ) -> bool:
-        """Execute a sub-workflow (workflow reference)."""
-        workflow_name = workflow_data.get("workflow")
-        if not workflow_name or not isinstance(workflow_name, str):
-            print("[Error] No workflow name specified in sub-workflow")
-            return False
-
-        description = workflow_data.get("description", f"Sub-workflow: {workflow_name}")
-        workflow_params = workflow_data.get("params", {})
-
-        # Merge parent params with workflow-specific params
-        merged_params = {**params, **workflow_params}
-
-        print(f"\n[Sub-Workflow] {description}")
-        # execute_workflow will handle relative paths using the workflow_stack
-        return self.execute_workflow(workflow_name, merged_params)
-
-    def _execute_condition(self, condition_data: Dict, params: Dict[str, Any]) -> bool:
-        """Execute a conditional branch."""
-        condition_name = condition_data.get("condition")
-        description = condition_data.get("description", condition_name)
-        on_true = condition_data.get("on_true", [])
-        on_false = condition_data.get("on_false", [])
-
-        if condition_name not in self.function_registry:
-            print(f"[Error] Condition '{condition_name}' not registered")
+    def _run_sub_workflow(self, step: _SubWorkflowStep, params: Dict[str, Any]) -> bool:
+        """Execute a compiled sub-workflow reference."""
+        # Merge parent params with workflow-specific params — a ChainMap view
+        # (workflow params shadow the parent's), so nothing is copied no
+        # matter how often the sub-workflow re-fires.
+        merged_params = ChainMap(step.params, params)
+
+        _log.info("\n[Sub-Workflow] %s", step.description)
+        # execute_workflow resolves relative paths against _current_parent
+        return self.execute_workflow(step.workflow, merged_params)
+
+    def _run_condition(self, step: _ConditionStep, params: Dict[str, Any]) -> bool:
+        """Execute a compiled conditional branch."""
+        condition_func = step.func or self.function_registry.get(step.name)
+        if condition_func is None:
+            _log.error("[Error] Condition '%s' not registered", step.name)
             return False
 
-        condition_func = self.function_registry[condition_name]
-
-        print(f"\n[Condition] Checking: {description}")
+        _log.info("\n[Condition] Checking: %s", step.description)
 
         try:
             result = condition_func()
             if result:
-                print("[Condition] ✓ True - executing true branch")
-                return self._execute_steps(on_true, params)
+                _log.info("[Condition] ✓ True - executing true branch")
+                return step.run_true(params)
             else:
-                print("[Condition] ✗ False - executing false branch")
-                return self._execute_steps(on_false, params)
+                _log.info("[Condition] ✗ False - executing false branch")
+                return step.run_false(params)
         except Exception as e:
-            print(f"[Condition] ✗ Error: {e}")
+            _log.warning("[Condition] ✗ Error: %s", e)
             return False
 
-    def _execute_event_loop(self, loop_data: Dict, params: Dict[str, Any]) -> bool:
-        """Execute an event loop."""
-        name = loop_data.get("name", "Event Loop")
-        interval = loop_data.get("interval", 10.0)
-        handlers = loop_data.get("handlers", [])
-
-        print(f"\n[EventLoop] Starting: {name} (interval: {interval}s)")
-        print("[EventLoop] Press Ctrl+C to stop")
+    def _run_event_loop(self, step: _EventLoopStep, params: Dict[str, Any]) -> bool:
+        """Execute a compiled event loop on asyncio."""
+        _log.info("\n[EventLoop] Starting: %s (interval: %ss)", step.name, step.interval)
+        _log.info("[EventLoop] Press Ctrl+C to stop")
 
         try:
-            while True:
-                for handler in handlers:
-                    handler_name = handler.get("name", "Handler")
-                    condition = handler.get("condition")
-                    actions = handler.get("actions", [])
-
-                    if condition and condition in self.function_registry:
-                        condition_func = self.function_registry[condition]
-                        if condition_func():
-                            print(f"\n[EventLoop] Trigger: {handler_name}")
-                            self._execute_steps(actions, params)
-
-                time.sleep(interval)
+            asyncio.run(self._run_event_loop_async(step, params))
         except KeyboardInterrupt:
-            print("\n[EventLoop] Stopped by user")
-            return True
-
+            _log.info("\n[EventLoop] Stopped by user")
         return True
 
+    async def _run_event_loop_async(
+        self, step: _EventLoopStep, params: Dict[str, Any]
+    ) -> None:
+        """Async body of the event loop.
+
+        Condition probes run concurrently on the default thread pool — they
+        spend their time in screen capture and OpenCV, which release the GIL —
+        and the interval wait is an awaited sleep, so Ctrl+C cancels
+        immediately instead of after up to ``interval`` seconds. Triggered
+        actions still run sequentially, in handler order.
+        """
+        # Everything about a handler is invariant for the loop's lifetime:
+        # resolve conditions and unpack names/actions once, and bind the
+        # methods the tick body needs to locals.
+        handlers = [
+            (handler.name, handler.func or self.function_registry.get(handler.condition), handler.run)
+            for handler in step.handlers
+            if handler.condition
+        ]
+        handlers = [entry for entry in handlers if entry[1] is not None]
+        to_thread = asyncio.to_thread
+
+        # Drift-compensated schedule: handler runtime is deducted from the
+        # wait so the effective period stays at ``interval``; if a tick
+        # overruns completely, re-sync instead of firing a catch-up burst.
+        next_tick = time.monotonic() + step.interval
+        while True:
+            triggered = await asyncio.gather(
+                *(to_thread(func) for _, func, _ in handlers)
+            )
+            for (name, _, run), fired in zip(handlers, triggered):
+                if fired:
+                    _log.info("\n[EventLoop] Trigger: %s", name)
+                    run(params)
+
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                next_tick += step.interval
+            else:
+                next_tick = time.monotonic() + step.interval
+
 
 # Legacy support classes (for backward compatibility)
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     """Legacy workflow step class."""
 
@@ -284,7 +634,7 @@ class WorkflowStep:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalStep:
     """Legacy conditional step class."""
 
@@ -447,48 +797,65 @@ class EventLoop:
         Args:
             max_iterations: Maximum number of iterations (None for infinite)
         """
-        print(f"\n{'='*60}")
-        print(f"Starting event loop: {self.name}")
-        print(f"Check interval: {self.check_interval}s")
-        print(f"{'='*60}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("\n%s", "=" * 60)
+            _log.info("Starting event loop: %s", self.name)
+            _log.info("Check interval: %ss", self.check_interval)
+            _log.info("%s", "=" * 60)
 
         self.running = True
-        iteration = 0
 
         try:
-            while self.running:
-                if max_iterations is not None and iteration >= max_iterations:
-                    print(f"\n[EventLoop] Reached max iterations ({max_iterations})")
-                    break
-
-                iteration += 1
-                print(f"\n[EventLoop] Iteration {iteration}")
-
-                for name, condition, action in self.handlers:
-                    try:
-                        if condition():
-                            print(f"[EventLoop] ✓ Event triggered: {name}")
-                            if action():
-                                print(f"[EventLoop] ✓ Action succeeded: {name}")
-                            else:
-                                print(f"[EventLoop] ✗ Action failed: {name}")
-                        else:
-                            print(f"[EventLoop] ⊘ Event not triggered: {name}")
-                    except Exception as e:
-                        print(f"[EventLoop] ✗ Error in handler '{name}': {e}")
-
-                print(
-                    f"[EventLoop] Waiting {self.check_interval}s before next check..."
-                )
-                time.sleep(self.check_interval)
-
+            asyncio.run(self._run_async(max_iterations))
         except KeyboardInterrupt:
-            print("\n[EventLoop] Interrupted by user")
+            _log.info("\n[EventLoop] Interrupted by user")
         finally:
             self.running = False
-            print(f"\n{'='*60}")
-            print(f"Event loop '{self.name}' stopped")
-            print(f"{'='*60}")
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("\n%s", "=" * 60)
+                _log.info("Event loop '%s' stopped", self.name)
+                _log.info("%s", "=" * 60)
+
+    async def _run_async(self, max_iterations: Optional[int] = None) -> None:
+        """Async body: conditions probe concurrently, the wait is cancellable."""
+        iteration = 0
+        next_tick = time.monotonic() + self.check_interval
+
+        while self.running:
+            if max_iterations is not None and iteration >= max_iterations:
+                _log.info("\n[EventLoop] Reached max iterations (%s)", max_iterations)
+                break
+
+            iteration += 1
+            _log.debug("\n[EventLoop] Iteration %d", iteration)
+
+            results = await asyncio.gather(
+                *(asyncio.to_thread(condition) for _, condition, _ in self.handlers),
+                return_exceptions=True,
+            )
+            for (name, _, action), result in zip(self.handlers, results):
+                try:
+                    if isinstance(result, BaseException):
+                        raise result
+                    if result:
+                        _log.info("[EventLoop] ✓ Event triggered: %s", name)
+                        if action():
+                            _log.info("[EventLoop] ✓ Action succeeded: %s", name)
+                        else:
+                            _log.warning("[EventLoop] ✗ Action failed: %s", name)
+                    else:
+                        _log.debug("[EventLoop] ⊘ Event not triggered: %s", name)
+                except Exception as e:
+                    _log.warning("[EventLoop] ✗ Error in handler '%s': %s", name, e)
+
+            _log.debug("[EventLoop] Waiting %ss before next check...", self.check_interval)
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                next_tick += self.check_interval
+            else:
+                # Fell behind; re-sync rather than firing a catch-up burst.
+                next_tick = time.monotonic() + self.check_interval
 
     def stop(self) -> None:
         """Stop the event loop."""